@@ -60,6 +60,7 @@ class DuckHuntGame:
         # Game loop variables
         self.clock = pygame.time.Clock()
         self.running = True
+        self.last_drawn_state = None
         
     def handle_input(self):
         """Handle all input events"""
@@ -82,6 +83,9 @@ class DuckHuntGame:
         elif actions['shoot'] and self.game_engine.state == PLAYING:
             self.game_engine.shoot(actions['cursor_position'])
             
+        if actions['toggle_help']:
+            self.ui_manager.show_help = not self.ui_manager.show_help
+            
         # Update cursor position
         cursor_pos = self.input_manager.get_cursor_position()
         self.game_engine.update_cursor(cursor_pos)
@@ -104,11 +108,20 @@ class DuckHuntGame:
         # Get gesture info if available
         gesture_info = self.input_manager.get_gesture_info()
         
+        # While play continues only the areas sprites moved through (and the HUD) are redrawn
+        dirty_rects = self.game_engine.get_dirty_rects()
+        if game_state != PLAYING or self.last_drawn_state != PLAYING:
+            dirty_rects = None
+            
         # Draw everything
-        self.ui_manager.draw_all(game_state, game_info, sprites, gesture_info)
+        changed = self.ui_manager.draw_all(game_state, game_info, sprites, gesture_info, dirty_rects)
         
-        # Update display
-        pygame.display.flip()
+        # Update display: only the changed areas when drawn incrementally, full flip otherwise
+        if changed is not None:
+            pygame.display.update(changed)
+        else:
+            pygame.display.flip()
+        self.last_drawn_state = game_state
         
     def run(self):
         """Main game loop"""
@@ -124,6 +137,7 @@ class DuckHuntGame:
         print("   • ESC: Salir")
         print("   • ENTER: Iniciar juego")
         print("   • R: Reiniciar (en fin de juego)")
+        print("   • H: Mostrar/ocultar ayuda de controles")
         
         # Main game loop
         while self.running:
@@ -45,7 +45,7 @@ class AIDuck(pygame.sprite.Sprite):
         self.points = self._get_points()
         
         # Load sprites
-        self.sprites = game.asset_manager.duck_sprites[color]
+        self.sprites = game.asset_manager.get_duck_sprites(color)
         self.current_animation = 'fly_right'
         self.animation_frame = 0
         self.animation_speed = 0.2
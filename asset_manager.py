@@ -4,11 +4,25 @@ Handles loading and managing all game assets (images, sounds, sprites)
 """
 import pygame
 import os
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from pygame import mixer
 
+# One silent Sound shared by every sound file that fails to load
+_SILENT_SOUND: Optional[mixer.Sound] = None
+
+def _get_silent() -> mixer.Sound:
+    """Get the shared silent sound, creating it on first call"""
+    global _SILENT_SOUND
+    if _SILENT_SOUND is None:
+        _SILENT_SOUND = mixer.Sound(buffer=bytearray(44))
+    return _SILENT_SOUND
+
 class AssetManager:
-    """Manages all game assets"""
+    """Manages all game assets (pygame.display.set_mode must be called first so images convert to the display format)"""
+    
+    __slots__ = ('images', 'sounds', 'duck_sprites', '_dir_cache',
+                 'cursor_img', 'background_img', 'foreground_img', 'paused_img',
+                 'shot_sound', 'beep_sound')
     
     def __init__(self):
         # Initialize pygame mixer
@@ -17,7 +31,15 @@ class AssetManager:
         # Asset storage
         self.images = {}
         self.sounds = {}
-        self.duck_sprites = {}
+        # Duck sprites per color, loaded on first request by get_duck_sprites
+        self.duck_sprites: Dict[str, Optional[Dict[str, Tuple[pygame.Surface, ...]]]] = {
+            'blue': None,
+            'red': None,
+            'black': None
+        }
+        
+        # Sprites subdirectory -> {filename: path}, listed once per directory
+        self._dir_cache: Dict[str, Dict[str, str]] = {}
         
         # Load all assets
         self.load_all_assets()
@@ -27,7 +49,14 @@ class AssetManager:
         self._create_directories()
         self._load_sounds()
         self._load_images()
-        self._load_duck_sprites()
+        
+        # Direct attributes for the assets read every frame
+        self.cursor_img = self.images['cursor_img']
+        self.background_img = self.images['background_img']
+        self.foreground_img = self.images['foreground_img']
+        self.paused_img = self.images['paused_img']
+        self.shot_sound = self.sounds['shot_sound']
+        self.beep_sound = self.sounds['beep_sound']
         
     def _create_directories(self):
         """Create necessary directories if they don't exist"""
@@ -59,11 +88,32 @@ class AssetManager:
             self.images[key] = self._load_image(filename)
             
     def _load_duck_sprites(self):
-        """Load all duck sprite animations"""
-        colors = ['blue', 'red', 'black']
-        
-        for color in colors:
-            self.duck_sprites[color] = self._load_duck_sprites_for_color(color)
+        """Load every duck color that has not been loaded yet"""
+        for color in self.duck_sprites:
+            self.get_duck_sprites(color)
+            
+    def _scan_sprite_dir(self, subdir: str) -> Dict[str, str]:
+        """List a Sprites subdirectory once and map each filename to its path"""
+        entries = self._dir_cache.get(subdir)
+        if entries is None:
+            try:
+                with os.scandir(os.path.join('Sprites', subdir)) as it:
+                    entries = {entry.name: entry.path for entry in it if entry.is_file()}
+            except OSError:
+                entries = {}
+            self._dir_cache[subdir] = entries
+        return entries
+        
+    def _load_image_path(self, path: str, use_alpha: bool = True) -> pygame.Surface:
+        """Load an image from a path known to exist, converted to the display format"""
+        try:
+            image = pygame.image.load(path)
+            return image.convert_alpha() if use_alpha else image.convert()
+        except Exception as e:
+            print(f"Error loading image {path}: {e}")
+            surf = pygame.Surface((32, 32))
+            surf.fill((255, 0, 255))  # Magenta placeholder
+            return surf
             
     def _load_sound(self, filename: str) -> mixer.Sound:
         """Load a sound file"""
@@ -72,8 +122,8 @@ class AssetManager:
             return mixer.Sound(path)
         except Exception as e:
             print(f"Warning: Could not load sound {filename}: {e}")
-            # Return a silent sound
-            return mixer.Sound(buffer=bytearray(44))
+            # Return the shared silent sound
+            return _get_silent()
             
     def _load_image(self, filename: str, scale: float = 1.0, use_alpha: bool = True) -> pygame.Surface:
         """Load an image file"""
@@ -102,10 +152,13 @@ class AssetManager:
             surf.fill((255, 0, 255))  # Magenta placeholder
             return surf
             
-    def _load_duck_sprites_for_color(self, color: str) -> Dict[str, List[pygame.Surface]]:
-        """Load all sprites for a duck of a specific color"""
+    def _load_duck_sprites_for_color(self, color: str) -> Dict[str, Tuple[pygame.Surface, ...]]:
+        """Load all sprites for a duck of a specific color (frames stored as immutable tuples)"""
         sprites = {}
         
+        # List the color directory once instead of probing each frame
+        paths = self._scan_sprite_dir(color)
+        
         # Define sprite categories and their frame ranges
         sprite_categories = {
             'fly_right': [1, 2, 3],
@@ -116,16 +169,15 @@ class AssetManager:
         }
         
         for category, frame_numbers in sprite_categories.items():
-            sprites[category] = []
-            
+            frames = []
             for frame_num in frame_numbers:
-                if category == 'die':
-                    filename = f"{color}/duck{frame_num}.png"
+                filename = f"duck{frame_num}.png"
+                path = paths.get(filename)
+                if path is not None:
+                    frames.append(self._load_image_path(path))
                 else:
-                    filename = f"{color}/duck{frame_num}.png"
-                    
-                sprite = self._load_image(filename)
-                sprites[category].append(sprite)
+                    frames.append(self._load_image(f"{color}/{filename}"))
+            sprites[category] = tuple(frames)
                 
         return sprites
         
@@ -137,35 +189,17 @@ class AssetManager:
         """Get a sound by key"""
         return self.sounds.get(key)
         
-    def get_duck_sprites(self, color: str) -> Dict[str, List[pygame.Surface]]:
-        """Get duck sprites for a specific color"""
-        return self.duck_sprites.get(color, {})
-        
-    def get_all_duck_sprites(self) -> Dict[str, Dict[str, List[pygame.Surface]]]:
+    def get_duck_sprites(self, color: str) -> Dict[str, Tuple[pygame.Surface, ...]]:
+        """Get duck sprites for a specific color (shared tuples, not copies), loading them on first use"""
+        if color not in self.duck_sprites:
+            return {}
+        entry = self.duck_sprites[color]
+        if entry is None:
+            entry = self._load_duck_sprites_for_color(color)
+            self.duck_sprites[color] = entry
+        return entry
+        
+    def get_all_duck_sprites(self) -> Dict[str, Dict[str, Tuple[pygame.Surface, ...]]]:
         """Get all duck sprites"""
+        self._load_duck_sprites()
         return self.duck_sprites
-        
-    # Property accessors for convenience
-    @property
-    def cursor_img(self) -> pygame.Surface:
-        return self.get_image('cursor_img')
-        
-    @property
-    def background_img(self) -> pygame.Surface:
-        return self.get_image('background_img')
-        
-    @property
-    def foreground_img(self) -> pygame.Surface:
-        return self.get_image('foreground_img')
-        
-    @property
-    def paused_img(self) -> pygame.Surface:
-        return self.get_image('paused_img')
-        
-    @property
-    def shot_sound(self) -> mixer.Sound:
-        return self.get_sound('shot_sound')
-        
-    @property
-    def beep_sound(self) -> mixer.Sound:
-        return self.get_sound('beep_sound') 
\ No newline at end of file
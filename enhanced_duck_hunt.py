@@ -4,9 +4,12 @@ Integrates all advanced features: AI, achievements, power-ups, game modes, stati
 """
 import pygame
 import os
+import sys
+import platform
 import random
 import math
 import json
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 from pygame import mixer
 
@@ -20,6 +23,30 @@ from enhanced_ai_ducks import EnhancedAIDuck
 from gesture_controller import GestureController
 from input_manager import InputManager
 
+# Fast JSON encoding for the AI data file (orjson is optional)
+try:
+    import orjson
+    
+    def _dumps(data: Dict[str, Any]) -> bytes:
+        return orjson.dumps(data)
+except ImportError:
+    def _dumps(data: Dict[str, Any]) -> bytes:
+        return json.dumps(data).encode('utf-8')
+
+def _set_timer_resolution(enable: bool):
+    """Request (or release) 1 ms scheduler granularity on Windows so clock.tick sleeps accurately"""
+    if sys.platform != 'win32':
+        return
+    try:
+        import ctypes
+        winmm = ctypes.windll.winmm
+        if enable:
+            winmm.timeBeginPeriod(1)
+        else:
+            winmm.timeEndPeriod(1)
+    except (ImportError, AttributeError, OSError):
+        pass
+
 # Suppress pygame welcome message
 os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
 
@@ -47,13 +74,39 @@ GAME_OVER = 4
 STATISTICS = 5
 ACHIEVEMENTS = 6
 
+# States that render the game scene (sprites and cursor) under the UI
+SCENE_STATES = (PLAYING, PAUSED, GAME_OVER)
+
+# The only event types the game reacts to
+INPUT_EVENT_TYPES = (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN)
+
+# High-rate event types the game never reads, kept out of the queue entirely
+NOISY_EVENT_TYPES = (pygame.MOUSEWHEEL, pygame.FINGERMOTION, pygame.MULTIGESTURE,
+                     pygame.JOYAXISMOTION, pygame.JOYBALLMOTION, pygame.JOYHATMOTION,
+                     pygame.CONTROLLERAXISMOTION)
+
+@lru_cache(maxsize=16)
+def _performance_rating(accuracy_bin: int, ducks_shot: int) -> str:
+    """Get performance rating for an accuracy bin (accuracy // 20) and capped duck count"""
+    if accuracy_bin >= 4 and ducks_shot >= 10:
+        return "¡EXCELENTE! 🏆"
+    elif accuracy_bin >= 3 and ducks_shot >= 7:
+        return "¡MUY BUENO! 🎯"
+    elif accuracy_bin >= 2 and ducks_shot >= 5:
+        return "BUENO 👍"
+    elif accuracy_bin >= 1 and ducks_shot >= 3:
+        return "REGULAR 😊"
+    else:
+        return "PRACTICA MÁS 💪"
+
 class EnhancedCursor(pygame.sprite.Sprite):
     """Enhanced cursor with visual effects"""
     
     def __init__(self, game):
         super().__init__()
         self.game = game
-        self.image = game.asset_manager.cursor_img
+        # Match the display pixel format so rotating/blitting skips per-pixel conversion
+        self.image = game.asset_manager.cursor_img.convert_alpha()
         self.rect = self.image.get_rect()
         self.rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
         
@@ -78,12 +131,8 @@ class EnhancedCursor(pygame.sprite.Sprite):
         if self.rotation >= 360:
             self.rotation = 0
             
-        # Apply transformations
-        rotated = pygame.transform.rotate(self.original_image, self.rotation)
-        scaled = pygame.transform.scale(rotated, 
-                                      (int(rotated.get_width() * self.scale),
-                                       int(rotated.get_height() * self.scale)))
-        self.image = scaled
+        # Apply transformations (rotate and scale in a single pass)
+        self.image = pygame.transform.rotozoom(self.original_image, self.rotation, self.scale)
         self.rect = self.image.get_rect(center=self.rect.center)
 
 class EnhancedGameEngine:
@@ -100,6 +149,7 @@ class EnhancedGameEngine:
         self.total_ducks = 0
         self.game_time = 60000
         self.start_time = 0
+        self._end_tick = 0  # 0 while the current mode has no time limit
         
         # AI system
         self.ai_level = 1
@@ -108,7 +158,7 @@ class EnhancedGameEngine:
         
         # Enhanced systems
         self.achievement_system = AchievementSystem()
-        self.powerup_system = PowerUpSystem(self)
+        self.powerup_system = PowerUpSystem(self, SCREEN_HEIGHT)
         self.game_mode_manager = GameModeManager()
         self.statistics_system = StatisticsSystem()
         
@@ -125,6 +175,10 @@ class EnhancedGameEngine:
         self.spawn_timer = 0
         self.spawn_delay = 2000
         
+        # Duck colors and their cumulative spawn probabilities (50% / 30% / 20%)
+        self._duck_colors = tuple(self.asset_manager.duck_sprites.keys())
+        self._duck_color_cum = (0.5, 0.8, 1.0)
+        
         # Player tracking
         self.player_position = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
         self.player_accuracy = 0.0
@@ -135,6 +189,12 @@ class EnhancedGameEngine:
         self.survival_timer = 0
         self.survival_level = 1
         
+        # Last payload written to ai_data.json (skips rewriting unchanged data)
+        self._saved_ai_data: Optional[bytes] = None
+        
+        # Game info snapshot, refreshed in place by get_game_info()
+        self._game_info: Dict[str, Any] = {}
+        
         # Initialize game objects
         self._init_game_objects()
         
@@ -149,12 +209,12 @@ class EnhancedGameEngine:
         
         # Create background and foreground
         self.background = pygame.sprite.Sprite()
-        self.background.image = self.asset_manager.background_img
+        self.background.image = self.asset_manager.background_img.convert()
         self.background.rect = self.background.image.get_rect()
         self.background.rect.topleft = (0, 0)
         
         self.foreground = pygame.sprite.Sprite()
-        self.foreground.image = self.asset_manager.foreground_img
+        self.foreground.image = self.asset_manager.foreground_img.convert_alpha()
         self.foreground.rect = self.foreground.image.get_rect()
         self.foreground.rect.bottomleft = (0, SCREEN_HEIGHT)
         
@@ -179,8 +239,12 @@ class EnhancedGameEngine:
             'games_played': self.games_played,
             'performance_history': self.performance_history
         }
-        with open('ai_data.json', 'w') as f:
-            json.dump(data, f, indent=2)
+        payload = _dumps(data)
+        if payload == self._saved_ai_data:
+            return
+        with open('ai_data.json', 'wb') as f:
+            f.write(payload)
+        self._saved_ai_data = payload
             
     def start_game(self, mode: GameMode = GameMode.CLASSIC):
         """Start a new game with specified mode"""
@@ -192,7 +256,9 @@ class EnhancedGameEngine:
         self.ducks_shot = 0
         self.total_shots = 0
         self.total_ducks = 0
+        self.player_accuracy = 0.0
         self.start_time = pygame.time.get_ticks()
+        self._end_tick = self.start_time + self.game_time if self.game_time > 0 else 0
         self.spawn_timer = 0
         
         # Reset systems
@@ -221,6 +287,7 @@ class EnhancedGameEngine:
         self.ducks_shot = 0
         self.total_shots = 0
         self.total_ducks = 0
+        self.player_accuracy = 0.0
         
         # Clear ducks
         for duck in self.ducks:
@@ -251,9 +318,9 @@ class EnhancedGameEngine:
             
     def spawn_duck(self):
         """Spawn a new enhanced AI duck"""
-        colors = list(self.asset_manager.duck_sprites.keys())
-        weights = [0.5, 0.3, 0.2]
-        color = random.choices(colors, weights=weights)[0]
+        r = random.random()
+        cum = self._duck_color_cum
+        color = self._duck_colors[0 if r < cum[0] else 1 if r < cum[1] else 2]
         
         # Use enhanced AI duck
         duck = EnhancedAIDuck(self, color, self.ai_level)
@@ -268,6 +335,7 @@ class EnhancedGameEngine:
             return
             
         self.total_shots += 1
+        self.player_accuracy = (self.ducks_shot / self.total_shots) * 100
         if self.shots_remaining is not None:
             self.shots_remaining -= 1
             
@@ -280,18 +348,26 @@ class EnhancedGameEngine:
                 return
                 
         # Check for duck hits
+        duck = self._find_hit_duck(position)
+        if duck is not None:
+            duck.hit()
+            
+            # Apply power-up effects
+            points = duck.points
+            if self.powerup_system.has_effect(PowerUpType.DOUBLE_POINTS):
+                points *= 2
+                
+            self.score += points
+            self.ducks_shot += 1
+            self.player_accuracy = (self.ducks_shot / self.total_shots) * 100
+            
+    def _find_hit_duck(self, position: tuple) -> Optional[EnhancedAIDuck]:
+        """Get the first live duck whose bounding box contains position"""
+        # A handful of ducks at most, so a plain Rect test beats gathering boxes into an array
         for duck in self.ducks:
             if duck.alive and duck.rect.collidepoint(position):
-                duck.hit()
-                
-                # Apply power-up effects
-                points = duck.points
-                if self.powerup_system.has_effect(PowerUpType.DOUBLE_POINTS):
-                    points *= 2
-                    
-                self.score += points
-                self.ducks_shot += 1
-                break
+                return duck
+        return None
                 
     def update(self, delta_time: float):
         """Update game state"""
@@ -325,8 +401,7 @@ class EnhancedGameEngine:
             self.cursor.update(self.player_position)
             
         # Check game time
-        current_time = pygame.time.get_ticks()
-        if self.game_time > 0 and current_time - self.start_time >= self.game_time:
+        if self._end_tick and pygame.time.get_ticks() >= self._end_tick:
             self.state = GAME_OVER
             self.games_played += 1
             
@@ -338,7 +413,9 @@ class EnhancedGameEngine:
     def update_cursor(self, position: tuple):
         """Update cursor position"""
         if self.cursor and position and len(position) == 2:
-            self.cursor.update(position)
+            # The cursor is only visible over the game scene
+            if self.state in SCENE_STATES:
+                self.cursor.update(position)
             self.player_position = position
             
     def get_player_position(self) -> tuple:
@@ -347,29 +424,25 @@ class EnhancedGameEngine:
         
     def get_time_remaining(self) -> int:
         """Get time remaining in milliseconds"""
-        if self.game_time <= 0:
+        if not self._end_tick:
             return 0
-        current_time = pygame.time.get_ticks()
-        return max(0, self.game_time - (current_time - self.start_time))
+        return max(0, self._end_tick - pygame.time.get_ticks())
         
     def get_game_info(self) -> Dict[str, Any]:
-        """Get current game information"""
-        time_remaining = self.get_time_remaining()
-        accuracy = (self.ducks_shot / max(1, self.total_shots)) * 100
-        
-        return {
-            "state": self.state,
-            "score": self.score,
-            "ducks_shot": self.ducks_shot,
-            "total_shots": self.total_shots,
-            "accuracy": accuracy,
-            "time_remaining": time_remaining,
-            "total_ducks": self.total_ducks,
-            "ai_level": self.ai_level,
-            "games_played": self.games_played,
-            "shots_remaining": self.shots_remaining,
-            "survival_level": getattr(self, 'survival_level', 1)
-        }
+        """Get current game information (the same dict is updated and returned on every call)"""
+        info = self._game_info
+        info["state"] = self.state
+        info["score"] = self.score
+        info["ducks_shot"] = self.ducks_shot
+        info["total_shots"] = self.total_shots
+        info["accuracy"] = self.player_accuracy
+        info["time_remaining"] = self.get_time_remaining()
+        info["total_ducks"] = self.total_ducks
+        info["ai_level"] = self.ai_level
+        info["games_played"] = self.games_played
+        info["shots_remaining"] = self.shots_remaining
+        info["survival_level"] = self.survival_level
+        return info
         
     def get_sprites(self) -> pygame.sprite.LayeredUpdates:
         """Get sprite group for rendering"""
@@ -419,6 +492,39 @@ class EnhancedUIManager:
         self.screen_width = screen.get_width()
         self.screen_height = screen.get_height()
         
+        # Power-up indicator surfaces (built once, blitted every frame)
+        self._bar_width = 150
+        self._bar_height = 8
+        self._bar_bg = pygame.Surface((self._bar_width, self._bar_height))
+        self._bar_bg.fill((100, 100, 100))
+        self._bar_fg = pygame.Surface((self._bar_width, self._bar_height))
+        self._bar_fg.fill(GREEN)
+        self._bar_area = pygame.Rect(0, 0, self._bar_width, self._bar_height)
+        self._indicator_panels: Dict[int, pygame.Surface] = {}
+        
+        # Rendered "Calificación" lines, keyed by rating
+        self._rating_surfaces: Dict[str, pygame.Surface] = {}
+        
+        # State -> UI draw handler, all called as (game_info, powerups, achievements, modes, stats)
+        self._state_draw_handlers = {
+            MENU: lambda info, powerups, achievements, modes, stats: self.draw_menu(info),
+            MODE_SELECTION: lambda info, powerups, achievements, modes, stats: self.draw_mode_selection(modes),
+            PLAYING: lambda info, powerups, achievements, modes, stats: self.draw_hud(info, powerups),
+            PAUSED: lambda info, powerups, achievements, modes, stats: self._draw_paused_hud(info, powerups),
+            GAME_OVER: lambda info, powerups, achievements, modes, stats: self.draw_game_over(info, achievements),
+            STATISTICS: lambda info, powerups, achievements, modes, stats: self.draw_statistics(stats),
+            ACHIEVEMENTS: lambda info, powerups, achievements, modes, stats: self.draw_achievements(achievements)
+        }
+        
+    def _center_pos(self, surface: pygame.Surface, center_y: int) -> tuple:
+        """Get the blit position that centers surface horizontally at center_y"""
+        return (self.screen_width // 2 - surface.get_width() // 2,
+                center_y - surface.get_height() // 2)
+        
+    def _topright_pos(self, surface: pygame.Surface, top: int) -> tuple:
+        """Get the blit position that right-aligns surface 10px from the screen edge"""
+        return (self.screen_width - 10 - surface.get_width(), top)
+        
     def draw_menu(self, game_info: Dict[str, Any] = None):
         """Draw enhanced main menu"""
         # Clear screen
@@ -426,13 +532,11 @@ class EnhancedUIManager:
         
         # Title
         title = self.big_font.render("PYHUNT ULTIMATE", True, BLACK)
-        title_rect = title.get_rect(center=(self.screen_width // 2, 60))
-        self.screen.blit(title, title_rect)
+        self.screen.blit(title, self._center_pos(title, 60))
         
         # Subtitle
         subtitle = self.font.render("Duck Hunt con IA Avanzada", True, BLACK)
-        subtitle_rect = subtitle.get_rect(center=(self.screen_width // 2, 100))
-        self.screen.blit(subtitle, subtitle_rect)
+        self.screen.blit(subtitle, self._center_pos(subtitle, 100))
         
         # Stats summary
         if game_info:
@@ -445,8 +549,7 @@ class EnhancedUIManager:
             y_offset = 140
             for stat in stats_text:
                 text = self.font.render(stat, True, BLACK)
-                text_rect = text.get_rect(center=(self.screen_width // 2, y_offset))
-                self.screen.blit(text, text_rect)
+                self.screen.blit(text, self._center_pos(text, y_offset))
                 y_offset += 25
                 
         # Menu options
@@ -458,12 +561,13 @@ class EnhancedUIManager:
             "5. Salir"
         ]
         
+        blit_ops = []
         y_offset = 220
         for option in options:
             text = self.font.render(option, True, BLACK)
-            text_rect = text.get_rect(center=(self.screen_width // 2, y_offset))
-            self.screen.blit(text, text_rect)
+            blit_ops.append((text, self._center_pos(text, y_offset)))
             y_offset += 30
+        self.screen.blits(blit_ops, doreturn=False)
             
     def draw_mode_selection(self, mode_manager: GameModeManager):
         """Draw game mode selection screen"""
@@ -471,8 +575,7 @@ class EnhancedUIManager:
         
         # Title
         title = self.big_font.render("SELECCIONAR MODO", True, BLACK)
-        title_rect = title.get_rect(center=(self.screen_width // 2, 40))
-        self.screen.blit(title, title_rect)
+        self.screen.blit(title, self._center_pos(title, 40))
         
         # Mode list
         modes = mode_manager.get_mode_list()
@@ -491,59 +594,57 @@ class EnhancedUIManager:
             
         # Instructions
         instruction = self.font.render("Presiona el número del modo o ESC para volver", True, RED)
-        instruction_rect = instruction.get_rect(center=(self.screen_width // 2, 420))
-        self.screen.blit(instruction, instruction_rect)
+        self.screen.blit(instruction, self._center_pos(instruction, 420))
         
     def draw_hud(self, game_info: Dict[str, Any], powerup_system: PowerUpSystem):
         """Draw enhanced heads-up display"""
-        # Score
+        # Score, ducks shot, accuracy and AI level
         score_text = self.font.render(f"Puntos: {game_info['score']}", True, WHITE)
-        self.screen.blit(score_text, (10, 10))
-        
-        # Ducks shot
         ducks_text = self.font.render(f"Patos: {game_info['ducks_shot']}", True, WHITE)
-        self.screen.blit(ducks_text, (10, 35))
-        
-        # Accuracy
         accuracy = game_info['accuracy']
         accuracy_text = self.font.render(f"Precisión: {accuracy:.1f}%", True, WHITE)
-        self.screen.blit(accuracy_text, (10, 60))
-        
-        # AI Level
         ai_text = self.font.render(f"IA Nivel: {game_info['ai_level']}", True, ORANGE)
-        self.screen.blit(ai_text, (10, 85))
         
-        # Time remaining
+        # Time remaining and shots
         time_remaining = game_info['time_remaining'] // 1000
         time_text = self.font.render(f"Tiempo: {time_remaining}s", True, WHITE)
-        time_rect = time_text.get_rect()
-        time_rect.topright = (self.screen_width - 10, 10)
-        self.screen.blit(time_text, time_rect)
-        
-        # Shots
         shots_text = self.font.render(f"Disparos: {game_info['total_shots']}", True, WHITE)
-        shots_rect = shots_text.get_rect()
-        shots_rect.topright = (self.screen_width - 10, 35)
-        self.screen.blit(shots_text, shots_rect)
+        
+        blit_ops = [
+            (score_text, (10, 10)),
+            (ducks_text, (10, 35)),
+            (accuracy_text, (10, 60)),
+            (ai_text, (10, 85)),
+            (time_text, self._topright_pos(time_text, 10)),
+            (shots_text, self._topright_pos(shots_text, 35))
+        ]
         
         # Shots remaining (for precision mode)
         if game_info.get('shots_remaining') is not None:
             shots_remaining = game_info['shots_remaining']
             shots_remaining_text = self.font.render(f"Disparos Restantes: {shots_remaining}", True, YELLOW)
-            shots_remaining_rect = shots_remaining_text.get_rect()
-            shots_remaining_rect.topright = (self.screen_width - 10, 60)
-            self.screen.blit(shots_remaining_text, shots_remaining_rect)
+            blit_ops.append((shots_remaining_text, self._topright_pos(shots_remaining_text, 60)))
             
         # Survival level
         if game_info.get('survival_level'):
             survival_text = self.font.render(f"Nivel: {game_info['survival_level']}", True, PURPLE)
-            survival_rect = survival_text.get_rect()
-            survival_rect.topright = (self.screen_width - 10, 85)
-            self.screen.blit(survival_text, survival_rect)
+            blit_ops.append((survival_text, self._topright_pos(survival_text, 85)))
+            
+        self.screen.blits(blit_ops, doreturn=False)
             
         # Active power-ups
         self._draw_powerup_indicators(powerup_system)
         
+    def _get_indicator_panel(self, effect_count: int) -> pygame.Surface:
+        """Get the cached translucent panel sized for effect_count indicators"""
+        panel = self._indicator_panels.get(effect_count)
+        if panel is None:
+            panel = pygame.Surface((200, effect_count * 25 + 10))
+            panel.set_alpha(180)
+            panel.fill(BLACK)
+            self._indicator_panels[effect_count] = panel
+        return panel
+        
     def _draw_powerup_indicators(self, powerup_system: PowerUpSystem):
         """Draw active power-up indicators"""
         active_effects = powerup_system.get_active_effects()
@@ -551,34 +652,24 @@ class EnhancedUIManager:
             return
             
         # Background for power-up indicators
-        bg_width = 200
-        bg_height = len(active_effects) * 25 + 10
-        bg_surface = pygame.Surface((bg_width, bg_height))
-        bg_surface.set_alpha(180)
-        bg_surface.fill(BLACK)
+        bg_surface = self._get_indicator_panel(len(active_effects))
+        bg_height = bg_surface.get_height()
         self.screen.blit(bg_surface, (10, self.screen_height - bg_height - 10))
         
         y_offset = self.screen_height - bg_height
+        bar_area = self._bar_area
+        now_ms = powerup_system.clock_ms
         for effect in active_effects:
             # Power-up icon and name
             icon_text = self.small_font.render(f"{effect.powerup_type.value}", True, WHITE)
             self.screen.blit(icon_text, (15, y_offset + 5))
             
-            # Progress bar
-            progress = effect.get_remaining_percentage()
-            bar_width = 150
-            bar_height = 8
-            bar_x = 15
-            bar_y = y_offset + 20
-            
-            # Background bar
-            pygame.draw.rect(self.screen, (100, 100, 100), 
-                           (bar_x, bar_y, bar_width, bar_height))
-            
-            # Progress bar
-            progress_width = int(bar_width * progress)
-            pygame.draw.rect(self.screen, GREEN, 
-                           (bar_x, bar_y, progress_width, bar_height))
+            # Progress bar: full background, then the filled slice of the green bar
+            bar_pos = (15, y_offset + 20)
+            self.screen.blit(self._bar_bg, bar_pos)
+            bar_area.width = int(self._bar_width * effect.get_remaining_percentage(now_ms))
+            if bar_area.width > 0:
+                self.screen.blit(self._bar_fg, bar_pos, bar_area)
             
             y_offset += 30
             
@@ -592,13 +683,16 @@ class EnhancedUIManager:
         
         # Pause text
         pause_text = self.big_font.render("PAUSA", True, WHITE)
-        pause_rect = pause_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 - 50))
-        self.screen.blit(pause_text, pause_rect)
+        self.screen.blit(pause_text, self._center_pos(pause_text, self.screen_height // 2 - 50))
         
         # Instructions
         instruction_text = self.font.render("Presiona P para continuar", True, WHITE)
-        instruction_rect = instruction_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 20))
-        self.screen.blit(instruction_text, instruction_rect)
+        self.screen.blit(instruction_text, self._center_pos(instruction_text, self.screen_height // 2 + 20))
+        
+    def _draw_paused_hud(self, game_info: Dict[str, Any], powerup_system: PowerUpSystem):
+        """Draw the frozen HUD under the pause overlay"""
+        self.draw_hud(game_info, powerup_system)
+        self.draw_paused()
         
     def draw_game_over(self, game_info: Dict[str, Any], achievement_system: AchievementSystem):
         """Draw enhanced game over screen"""
@@ -610,65 +704,50 @@ class EnhancedUIManager:
         
         # Game over text
         game_over_text = self.big_font.render("¡FIN DEL JUEGO!", True, RED)
-        game_over_rect = game_over_text.get_rect(center=(self.screen_width // 2, 60))
-        self.screen.blit(game_over_text, game_over_rect)
+        self.screen.blit(game_over_text, self._center_pos(game_over_text, 60))
         
         # Final score
         score_text = self.font.render(f"Puntuación Final: {game_info['score']}", True, WHITE)
-        score_rect = score_text.get_rect(center=(self.screen_width // 2, 120))
-        self.screen.blit(score_text, score_rect)
+        self.screen.blit(score_text, self._center_pos(score_text, 120))
         
         # Ducks shot
         ducks_text = self.font.render(f"Patos Abatidos: {game_info['ducks_shot']}", True, WHITE)
-        ducks_rect = ducks_text.get_rect(center=(self.screen_width // 2, 145))
-        self.screen.blit(ducks_text, ducks_rect)
+        self.screen.blit(ducks_text, self._center_pos(ducks_text, 145))
         
         # Accuracy
         accuracy = game_info['accuracy']
         accuracy_text = self.font.render(f"Precisión: {accuracy:.1f}%", True, WHITE)
-        accuracy_rect = accuracy_text.get_rect(center=(self.screen_width // 2, 170))
-        self.screen.blit(accuracy_text, accuracy_rect)
+        self.screen.blit(accuracy_text, self._center_pos(accuracy_text, 170))
         
         # AI Level
         ai_text = self.font.render(f"Nivel de IA: {game_info['ai_level']}", True, ORANGE)
-        ai_rect = ai_text.get_rect(center=(self.screen_width // 2, 195))
-        self.screen.blit(ai_text, ai_rect)
+        self.screen.blit(ai_text, self._center_pos(ai_text, 195))
         
         # Performance rating
         rating = self._get_performance_rating(accuracy, game_info['ducks_shot'])
-        rating_text = self.font.render(f"Calificación: {rating}", True, YELLOW)
-        rating_rect = rating_text.get_rect(center=(self.screen_width // 2, 230))
-        self.screen.blit(rating_text, rating_rect)
+        rating_text = self._rating_surfaces.get(rating)
+        if rating_text is None:
+            rating_text = self.font.render(f"Calificación: {rating}", True, YELLOW)
+            self._rating_surfaces[rating] = rating_text
+        self.screen.blit(rating_text, self._center_pos(rating_text, 230))
         
         # Achievement progress
         achievement_progress = achievement_system.get_achievement_progress()
         achievement_text = self.font.render(
             f"Logros: {achievement_progress['unlocked_count']}/{achievement_progress['total_achievements']}", 
             True, GREEN)
-        achievement_rect = achievement_text.get_rect(center=(self.screen_width // 2, 260))
-        self.screen.blit(achievement_text, achievement_rect)
+        self.screen.blit(achievement_text, self._center_pos(achievement_text, 260))
         
         # Instructions
         restart_text = self.font.render("Presiona R para jugar de nuevo", True, GREEN)
-        restart_rect = restart_text.get_rect(center=(self.screen_width // 2, 300))
-        self.screen.blit(restart_text, restart_rect)
+        self.screen.blit(restart_text, self._center_pos(restart_text, 300))
         
         exit_text = self.font.render("Presiona ESC para salir", True, WHITE)
-        exit_rect = exit_text.get_rect(center=(self.screen_width // 2, 330))
-        self.screen.blit(exit_text, exit_rect)
+        self.screen.blit(exit_text, self._center_pos(exit_text, 330))
         
     def _get_performance_rating(self, accuracy: float, ducks_shot: int) -> str:
         """Get performance rating based on accuracy and ducks shot"""
-        if accuracy >= 80 and ducks_shot >= 10:
-            return "¡EXCELENTE! 🏆"
-        elif accuracy >= 60 and ducks_shot >= 7:
-            return "¡MUY BUENO! 🎯"
-        elif accuracy >= 40 and ducks_shot >= 5:
-            return "BUENO 👍"
-        elif accuracy >= 20 and ducks_shot >= 3:
-            return "REGULAR 😊"
-        else:
-            return "PRACTICA MÁS 💪"
+        return _performance_rating(int(accuracy) // 20, min(ducks_shot, 10))
         
     def draw_statistics(self, statistics_system: StatisticsSystem):
         """Draw statistics screen"""
@@ -677,8 +756,7 @@ class EnhancedUIManager:
             
         # Title
         title = self.big_font.render("ESTADÍSTICAS", True, BLACK)
-        title_rect = title.get_rect(center=(self.screen_width // 2, 40))
-        self.screen.blit(title, title_rect)
+        self.screen.blit(title, self._center_pos(title, 40))
         
         # Get player stats
         player_stats = statistics_system.get_player_stats()
@@ -705,8 +783,7 @@ class EnhancedUIManager:
             
         # Instructions
         instruction = self.font.render("Presiona ESC para volver al menú", True, RED)
-        instruction_rect = instruction.get_rect(center=(self.screen_width // 2, 420))
-        self.screen.blit(instruction, instruction_rect)
+        self.screen.blit(instruction, self._center_pos(instruction, 420))
         
     def draw_achievements(self, achievement_system: AchievementSystem):
         """Draw achievements screen"""
@@ -715,21 +792,18 @@ class EnhancedUIManager:
             
         # Title
         title = self.big_font.render("LOGROS", True, BLACK)
-        title_rect = title.get_rect(center=(self.screen_width // 2, 30))
-        self.screen.blit(title, title_rect)
+        self.screen.blit(title, self._center_pos(title, 30))
         
         # Progress summary
         progress = achievement_system.get_achievement_progress()
         progress_text = self.font.render(
             f"Progreso: {progress['unlocked_count']}/{progress['total_achievements']} "
             f"({progress['completion_percentage']:.1f}%)", True, BLACK)
-        progress_rect = progress_text.get_rect(center=(self.screen_width // 2, 70))
-        self.screen.blit(progress_text, progress_rect)
+        self.screen.blit(progress_text, self._center_pos(progress_text, 70))
         
         # Points
         points_text = self.font.render(f"Puntos de Logros: {progress['total_points']}", True, ORANGE)
-        points_rect = points_text.get_rect(center=(self.screen_width // 2, 100))
-        self.screen.blit(points_text, points_rect)
+        self.screen.blit(points_text, self._center_pos(points_text, 100))
         
         # Show unlocked achievements
         unlocked = achievement_system.get_unlocked_achievements()
@@ -748,13 +822,11 @@ class EnhancedUIManager:
                 y_offset += 20
         else:
             no_achievements = self.font.render("¡Aún no has desbloqueado logros!", True, BLACK)
-            no_achievements_rect = no_achievements.get_rect(center=(self.screen_width // 2, 200))
-            self.screen.blit(no_achievements, no_achievements_rect)
+            self.screen.blit(no_achievements, self._center_pos(no_achievements, 200))
             
         # Instructions
         instruction = self.font.render("Presiona ESC para volver al menú", True, RED)
-        instruction_rect = instruction.get_rect(center=(self.screen_width // 2, 420))
-        self.screen.blit(instruction, instruction_rect)
+        self.screen.blit(instruction, self._center_pos(instruction, 420))
             
     def draw_all(self, game_state: int, game_info: Dict[str, Any], 
                  sprites: pygame.sprite.LayeredUpdates, 
@@ -763,28 +835,23 @@ class EnhancedUIManager:
                  mode_manager: GameModeManager = None,
                  statistics_system: StatisticsSystem = None):
         """Draw everything based on game state"""
-        # Clear screen
-        self.screen.fill((135, 206, 250))
-        
-        # Draw sprites
-        sprites.draw(self.screen)
+        # Clear screen. Gameplay states are fully covered by the background sprite
+        # and the menu/mode screens clear themselves, so only these two need it.
+        if game_state in (STATISTICS, ACHIEVEMENTS):
+            self.screen.fill((135, 206, 250))
+        
+        # Draw sprites (menu screens cover the scene entirely)
+        if game_state in SCENE_STATES:
+            sprites.draw(self.screen)
+            
+        # Falling power-ups sit over the ducks and under the HUD, only while playing
+        if game_state == PLAYING and powerup_system:
+            powerup_system.draw(self.screen)
         
         # Draw UI based on state
-        if game_state == MENU:
-            self.draw_menu(game_info)
-        elif game_state == MODE_SELECTION:
-            self.draw_mode_selection(mode_manager)
-        elif game_state == PLAYING:
-            self.draw_hud(game_info, powerup_system)
-        elif game_state == PAUSED:
-            self.draw_hud(game_info, powerup_system)
-            self.draw_paused()
-        elif game_state == GAME_OVER:
-            self.draw_game_over(game_info, achievement_system)
-        elif game_state == STATISTICS:
-            self.draw_statistics(statistics_system)
-        elif game_state == ACHIEVEMENTS:
-            self.draw_achievements(achievement_system)
+        handler = self._state_draw_handlers.get(game_state)
+        if handler:
+            handler(game_info, powerup_system, achievement_system, mode_manager, statistics_system)
 
 class EnhancedDuckHuntGame:
     """Main enhanced Duck Hunt game"""
@@ -801,6 +868,9 @@ class EnhancedDuckHuntGame:
         # Hide system cursor
         pygame.mouse.set_visible(False)
         
+        # Keep noisy motion/joystick events out of the queue
+        pygame.event.set_blocked(NOISY_EVENT_TYPES)
+        
         # Initialize modules
         self.asset_manager = AssetManager()
         self.game_engine = EnhancedGameEngine(self.asset_manager)
@@ -821,13 +891,28 @@ class EnhancedDuckHuntGame:
                 print(f"⚠️ No se pudo inicializar el reconocimiento de gestos: {e}")
                 print("El juego funcionará solo con mouse/touchpad")
         
+        # State -> key press handler
+        self._keydown_handlers = {
+            MENU: self._handle_menu_key,
+            MODE_SELECTION: self._handle_mode_selection_key,
+            PLAYING: self._handle_playing_key,
+            PAUSED: self._handle_paused_key,
+            GAME_OVER: self._handle_game_over_key,
+            STATISTICS: self._handle_statistics_key,
+            ACHIEVEMENTS: self._handle_achievements_key
+        }
+        
         # Game loop variables
         self.clock = pygame.time.Clock()
         self.running = True
+        _set_timer_resolution(True)
         
     def handle_input(self):
         """Handle all input events"""
-        events = pygame.event.get()
+        pygame.event.pump()
+        events = pygame.event.get(INPUT_EVENT_TYPES, pump=False)
+        # Drop the other queued events so they do not pile up
+        pygame.event.clear(pump=False)
         actions = self.input_manager.handle_events(events)
 
         # --- Keep original event handling for everything except shooting/reset ---
@@ -837,8 +922,6 @@ class EnhancedDuckHuntGame:
                 return
             elif event.type == pygame.KEYDOWN:
                 self._handle_keydown(event.key)
-            elif event.type == pygame.MOUSEMOTION:
-                self.game_engine.update_cursor(event.pos)
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 if self.game_engine.state == PLAYING:
                     self.game_engine.shoot(event.pos)
@@ -851,25 +934,15 @@ class EnhancedDuckHuntGame:
         elif actions['shoot'] and self.game_engine.state == GAME_OVER:
             self.game_engine.reset_game()
 
-        # Always update cursor position (prefer gesture if available)
+        # Update cursor once per frame with the latest position (prefer gesture if
+        # available); intermediate MOUSEMOTION events are coalesced by InputManager
         self.game_engine.update_cursor(actions['cursor_position'])
             
     def _handle_keydown(self, key):
         """Handle key press events"""
-        if self.game_engine.state == MENU:
-            self._handle_menu_key(key)
-        elif self.game_engine.state == MODE_SELECTION:
-            self._handle_mode_selection_key(key)
-        elif self.game_engine.state == PLAYING:
-            self._handle_playing_key(key)
-        elif self.game_engine.state == PAUSED:
-            self._handle_paused_key(key)
-        elif self.game_engine.state == GAME_OVER:
-            self._handle_game_over_key(key)
-        elif self.game_engine.state == STATISTICS:
-            self._handle_statistics_key(key)
-        elif self.game_engine.state == ACHIEVEMENTS:
-            self._handle_achievements_key(key)
+        handler = self._keydown_handlers.get(self.game_engine.state)
+        if handler:
+            handler(key)
             
     def _handle_menu_key(self, key):
         """Handle key press in menu state"""
@@ -968,7 +1041,7 @@ class EnhancedDuckHuntGame:
         )
         
         # Draw cursor on top
-        if self.game_engine.cursor:
+        if self.game_engine.cursor and game_state in SCENE_STATES:
             self.screen.blit(self.game_engine.cursor.image, self.game_engine.cursor.rect)
         
         # Update display
@@ -1009,6 +1082,8 @@ class EnhancedDuckHuntGame:
         if self.gesture_controller:
             self.gesture_controller.stop()
             
+        self.game_engine.statistics_system.flush()
+        _set_timer_resolution(False)
         pygame.quit()
 
 def main():
@@ -1017,10 +1092,20 @@ def main():
     print("=" * 50)
     print("Duck Hunt con IA Avanzada y múltiples modos!")
     
+    args = [arg.lower() for arg in sys.argv[1:]]
+    
+    # PyPy reads its GC settings at startup, so restart once with them in the environment
+    # (only on PyPy, and only if they are not already set)
+    pypy_gc_vars = {'PYPY_GC_NURSERY': '1m', 'PYPY_GC_MAX_DELTA': '200MB'}
+    if ('--pypy-tuned' in args and platform.python_implementation() == 'PyPy'
+            and not all(var in os.environ for var in pypy_gc_vars)):
+        for var, value in pypy_gc_vars.items():
+            os.environ.setdefault(var, value)
+        os.execv(sys.executable, [sys.executable] + sys.argv)
+    
     # Check if user wants to use gestures
     use_gestures = False
-    import sys
-    if len(sys.argv) > 1 and sys.argv[1].lower() in ['--gestures', '-g']:
+    if '--gestures' in args or '-g' in args:
         use_gestures = True
         print("🎯 Modo: Mouse + Gestos")
     else:
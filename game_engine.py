@@ -6,12 +6,81 @@ import pygame
 import os
 import random
 import math
+import numpy as np
+from collections import deque
+from enum import IntEnum
 from typing import List, Dict, Any, Optional
 
+# Optional JIT for the duck physics and hit-test kernels
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 # Game constants
 SCREEN_WIDTH = 640
 SCREEN_HEIGHT = 480
 FPS = 50
+MAX_DUCKS = 32
+RAND_POOL_SIZE = 1024
+
+# Duck animations, indexed by the second axis of GameEngine.duck_frames
+DUCK_ANIMATIONS = ('fly_right', 'fly_left', 'die')
+ANIM_FLY_RIGHT = 0
+ANIM_FLY_LEFT = 1
+ANIM_DIE = 2
+
+# Per-duck physics state, one row per duck slot (structure of arrays)
+DUCK_STATE_DTYPE = np.dtype([
+    ('x', 'f4'),
+    ('y', 'f4'),
+    ('speed', 'f4'),
+    ('vy', 'f4'),
+    ('w', 'f4'),
+    ('h', 'f4'),
+    ('dir', 'i1'),  # -1 for left, 1 for right
+    ('alive', '?'),
+    ('dying', '?')
+])
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def step_ducks(x, y, speed, vy, w, h, direction, alive, dying, dt, sw, sh):
+        """Move alive ducks, bounce them off the screen edges and drop dying ones"""
+        for i in range(x.shape[0]):
+            if alive[i]:
+                x[i] += direction[i] * speed[i] * dt
+                y[i] += vy[i] * dt
+                
+                if x[i] < -w[i] or x[i] > sw:
+                    direction[i] = -direction[i]
+                    x[i] = min(max(x[i], -w[i]), sw)
+                    
+                if y[i] < 0 or y[i] + h[i] > sh:
+                    vy[i] = -vy[i]
+                    y[i] = min(max(y[i], 0.0), sh - h[i])
+            elif dying[i]:
+                y[i] += 200.0 * dt
+                
+    @njit(cache=True)
+    def hit_test(px, py, x, y, w, h, alive):
+        """Return the first alive duck slot whose rect contains (px, py), or -1"""
+        for i in range(x.shape[0]):
+            if not alive[i]:
+                continue
+            # Same integer truncation as Duck._sync_rect
+            left = int(x[i])
+            top = int(y[i])
+            if left <= px < left + int(w[i]) and top <= py < top + int(h[i]):
+                return i
+        return -1
+        
+    def warm_up_kernels(state: np.ndarray):
+        """Compile the kernels for the duck_state field types now, not on the first frame or shot"""
+        step_ducks(state['x'], state['y'], state['speed'], state['vy'], state['w'], state['h'],
+                   state['dir'], state['alive'], state['dying'], 0.0, SCREEN_WIDTH, SCREEN_HEIGHT)
+        hit_test(0, 0, state['x'], state['y'], state['w'], state['h'], state['alive'])
 
 # Colors
 WHITE = (255, 255, 255)
@@ -21,41 +90,70 @@ GREEN = (0, 255, 0)
 BLUE = (0, 0, 255)
 
 # Game states
-MENU = 0
-PLAYING = 1
-PAUSED = 2
-GAME_OVER = 3
+class GameState(IntEnum):
+    MENU = 0
+    PLAYING = 1
+    PAUSED = 2
+    GAME_OVER = 3
+
+MENU = GameState.MENU
+PLAYING = GameState.PLAYING
+PAUSED = GameState.PAUSED
+GAME_OVER = GameState.GAME_OVER
 
 class Duck(pygame.sprite.Sprite):
-    """Duck sprite with animation and physics"""
+    """Duck sprite with animation; its physics live in a row of the engine's duck_state"""
     
-    def __init__(self, game, color: str):
+    def __init__(self, game, slot: int):
         super().__init__()
         self.game = game
+        self.slot = slot
+        self.animation_speed = 0.2
+        self.die_duration = 1.0  # seconds
+        
+        # Physics (record view into game.duck_state, updated by GameEngine._step_ducks)
+        self.state = game.duck_state[slot]
+        
+        # Inert until the first reset(color) on spawn, so no sprites are loaded for it yet
+        self.color = None
+        self.image = None
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.anim_idx = None
+        self.alive = False
+        self.dying = False
+        self.state['alive'] = False
+        self.state['dying'] = False
+        
+    def reset(self, color: str):
+        """Reinitialize the duck for a new flight, reusing this instance"""
         self.color = color
         self.points = self._get_points()
         
-        # Load sprites
-        self.sprites = game.asset_manager.duck_sprites[color]
-        self.current_animation = 'fly_right'
+        # Animation frames come from the engine's flat duck_frames table
+        self.color_idx = self.game.duck_color_index[color]
+        self.game.ensure_duck_color(self.color_idx)
+        self.anim_idx = None
         self.animation_frame = 0
-        self.animation_speed = 0.2
         self.animation_timer = 0
+        self.set_animation(ANIM_FLY_RIGHT)
         
         # Set initial image
-        self.image = self.sprites[self.current_animation][0]
+        self.image = self.game.duck_frames[self.color_idx, ANIM_FLY_RIGHT, 0]
         self.rect = self.image.get_rect()
         
         # Physics
+        self.state['w'] = self.rect.width
+        self.state['h'] = self.rect.height
         self.alive = True
         self.dying = False
+        self.state['alive'] = True
+        self.state['dying'] = False
         self.die_timer = 0
-        self.die_duration = 1000  # milliseconds
         
         # Movement
-        self.speed = random.uniform(100, 200)
-        self.direction = random.choice([-1, 1])  # -1 for left, 1 for right
-        self.vertical_speed = random.uniform(-50, 50)
+        self.state['speed'] = random.uniform(100, 200)
+        self.state['dir'] = random.choice([-1, 1])
+        self.state['vy'] = self.game.random_vy()
         
         # Position
         self.spawn_position()
@@ -63,6 +161,7 @@ class Duck(pygame.sprite.Sprite):
         # State
         self.state_timer = 0
         self.change_direction_timer = 0
+        self.next_change_s = random.uniform(2.0, 5.0)
         
     def _get_points(self) -> int:
         """Get points based on duck color"""
@@ -76,12 +175,24 @@ class Duck(pygame.sprite.Sprite):
     def spawn_position(self):
         """Set initial spawn position"""
         # Spawn from left or right side
-        if self.direction == 1:  # Moving right
-            self.rect.x = -self.rect.width
-            self.rect.y = random.randint(50, SCREEN_HEIGHT // 2)
+        if self.state['dir'] == 1:  # Moving right
+            self.state['x'] = -self.rect.width
         else:  # Moving left
-            self.rect.x = SCREEN_WIDTH
-            self.rect.y = random.randint(50, SCREEN_HEIGHT // 2)
+            self.state['x'] = SCREEN_WIDTH
+        self.state['y'] = random.randint(50, SCREEN_HEIGHT // 2)
+        self._sync_rect()
+        
+    def set_animation(self, anim_idx: int):
+        """Switch animation, caching its frame count for animate"""
+        if anim_idx != self.anim_idx:
+            self.anim_idx = anim_idx
+            self._current_frames_len = int(self.game.duck_frame_counts[self.color_idx, anim_idx])
+            self.animation_frame %= self._current_frames_len
+            
+    def _sync_rect(self):
+        """Copy the physics position into the sprite rect"""
+        self.rect.x = int(self.state['x'])
+        self.rect.y = int(self.state['y'])
             
     def update(self, delta_time: float):
         """Update duck state"""
@@ -93,70 +204,70 @@ class Duck(pygame.sprite.Sprite):
         self.animate(delta_time)
         
     def update_alive(self, delta_time: float):
-        """Update alive duck movement"""
+        """Update alive duck timers and animation (movement and rect sync happen in the engine)"""
         # Update timers
-        self.state_timer += delta_time * 1000
-        self.change_direction_timer += delta_time * 1000
+        self.state_timer += delta_time
+        change_timer = self.change_direction_timer + delta_time
         
         # Change direction occasionally
-        if self.change_direction_timer > random.randint(2000, 5000):
+        if change_timer > self.next_change_s:
             self.change_direction()
-            self.change_direction_timer = 0
-            
-        # Move duck
-        self.rect.x += self.direction * self.speed * delta_time
-        self.rect.y += self.vertical_speed * delta_time
-        
-        # Bounce off screen edges
-        if self.rect.left < -self.rect.width or self.rect.right > SCREEN_WIDTH + self.rect.width:
-            self.direction *= -1
-            self.rect.x = max(-self.rect.width, min(self.rect.x, SCREEN_WIDTH))
-            
-        if self.rect.top < 0 or self.rect.bottom > SCREEN_HEIGHT:
-            self.vertical_speed *= -1
-            self.rect.y = max(0, min(self.rect.y, SCREEN_HEIGHT - self.rect.height))
+            change_timer = 0
+        self.change_direction_timer = change_timer
             
         # Update animation based on direction
-        if self.direction > 0:
-            self.current_animation = 'fly_right'
-        else:
-            self.current_animation = 'fly_left'
+        anim_idx = ANIM_FLY_RIGHT if self.state['dir'] > 0 else ANIM_FLY_LEFT
+        if anim_idx != self.anim_idx:
+            self.set_animation(anim_idx)
             
     def update_dying(self, delta_time: float):
         """Update dying duck animation"""
-        self.die_timer += delta_time * 1000
-        self.current_animation = 'die'
-        
-        # Fall down
-        self.rect.y += 200 * delta_time
+        die_timer = self.die_timer + delta_time
+        self.die_timer = die_timer
+        if self.anim_idx != ANIM_DIE:
+            self.set_animation(ANIM_DIE)
         
         # Remove when animation is complete
-        if self.die_timer > self.die_duration:
+        if die_timer > self.die_duration:
             self.kill()
             
     def change_direction(self):
         """Change duck direction"""
-        self.direction *= -1
-        self.vertical_speed = random.uniform(-50, 50)
+        self.state['dir'] = -self.state['dir']
+        self.state['vy'] = self.game.random_vy()
+        self.next_change_s = random.uniform(2.0, 5.0)
         
     def hit(self):
         """Handle duck being hit"""
         if self.alive:
             self.alive = False
             self.dying = True
+            self.state['alive'] = False
+            self.state['dying'] = True
             self.die_timer = 0
             self.game.beep_sound.play()
             
+    def kill(self):
+        """Remove the duck and return it to the engine's pool"""
+        if self.groups():
+            self.state['alive'] = False
+            self.state['dying'] = False
+            super().kill()
+            self.game.release_duck(self)
+            
     def animate(self, delta_time: float):
         """Animate duck sprite"""
-        self.animation_timer += delta_time
-        
-        if self.animation_timer >= self.animation_speed:
-            self.animation_timer = 0
-            self.animation_frame = (self.animation_frame + 1) % len(self.sprites[self.current_animation])
+        timer = self.animation_timer + delta_time
+        frame = self.animation_frame
+        
+        if timer >= self.animation_speed:
+            timer = 0
+            frame = (frame + 1) % self._current_frames_len
+            self.animation_frame = frame
+        self.animation_timer = timer
             
         # Update image
-        self.image = self.sprites[self.current_animation][self.animation_frame]
+        self.image = self.game.duck_frames[self.color_idx, self.anim_idx, frame]
 
 class Cursor(pygame.sprite.Sprite):
     """Custom cursor sprite"""
@@ -173,23 +284,18 @@ class Cursor(pygame.sprite.Sprite):
         if position and len(position) == 2:
             self.rect.center = position
 
-class Background(pygame.sprite.Sprite):
-    """Background sprite"""
+class StaticLayer:
+    """Immobile image blitted in one call; draws like a sprite group"""
     
-    def __init__(self, game):
-        super().__init__()
-        self.image = game.asset_manager.background_img
-        self.rect = self.image.get_rect()
-        self.rect.topleft = (0, 0)
-
-class Foreground(pygame.sprite.Sprite):
-    """Foreground sprite"""
+    __slots__ = ('image', 'position')
     
-    def __init__(self, game):
-        super().__init__()
-        self.image = game.asset_manager.foreground_img
-        self.rect = self.image.get_rect()
-        self.rect.bottomleft = (0, SCREEN_HEIGHT)
+    def __init__(self, image: pygame.Surface, position: tuple):
+        self.image = image
+        self.position = position
+        
+    def draw(self, surface: pygame.Surface):
+        """Blit the layer onto surface"""
+        surface.blit(self.image, self.position)
 
 class GameEngine:
     """Core game engine handling game logic"""
@@ -203,21 +309,56 @@ class GameEngine:
         self.ducks_shot = 0
         self.total_shots = 0
         self.total_ducks = 0
-        self.game_time = 60000  # 60 seconds
-        self.start_time = 0
+        self.game_time = 60.0  # seconds
+        self.elapsed = 0.0  # seconds of play, accumulated in update()
         
         # Sprite groups
-        self.all_sprites = pygame.sprite.LayeredUpdates()
         self.ducks = pygame.sprite.Group()
+        self.cursor_group = pygame.sprite.Group()
+        
+        # Fixed back-to-front draw order, filled in by _init_game_objects
+        self.draw_groups = ()
+        
+        # Duck physics (structure of arrays); pooled duck i owns row i
+        self.duck_state = np.zeros(MAX_DUCKS, dtype=DUCK_STATE_DTYPE)
+        self._duck_pool: List[Duck] = []
+        self._free_ducks = deque()
+        if HAS_NUMBA:
+            warm_up_kernels(self.duck_state)
+        
+        # Live ducks and their rects in spawn order, for Rect.collidelistall
+        self._duck_list: List[Duck] = []
+        self._duck_rects: List[pygame.Rect] = []
+        
+        # Sprite rects pushed to the display last frame
+        self._prev_rects: List[pygame.Rect] = []
+        
+        # Pre-drawn vertical speeds, refilled when exhausted
+        self._rand_pool = np.empty(0, dtype=np.float32)
+        self._rand_index = 0
         
         # Game objects
         self.cursor = None
         self.background = None
         self.foreground = None
         
+        # Game info returned by get_game_info, refreshed only after the game changes
+        self._info_cache: Dict[str, Any] = {}
+        self._info_cache_valid = False
+        
+        # Duck colors and their cumulative spawn weights (0.5, 0.3, 0.2)
+        self._duck_colors = tuple(asset_manager.duck_sprites.keys())
+        self.duck_color_index = {color: i for i, color in enumerate(self._duck_colors)}
+        
+        # Every duck frame in one (color, animation, frame) object array, filled per color on first use
+        self.duck_frames = np.empty((len(self._duck_colors), len(DUCK_ANIMATIONS), 1), dtype=object)
+        self.duck_frame_counts = np.zeros((len(self._duck_colors), len(DUCK_ANIMATIONS)),
+                                          dtype=np.int32)
+        self._duck_color_cum = (0.5, 0.8, 1.0)
+        
         # Game variables
         self.spawn_timer = 0
-        self.spawn_delay = 2000  # milliseconds
+        self.spawn_delay = 2.0  # seconds
         
         # Initialize game objects
         self._init_game_objects()
@@ -226,13 +367,21 @@ class GameEngine:
         """Initialize game objects"""
         # Create cursor
         self.cursor = Cursor(self)
-        self.all_sprites.add(self.cursor)
+        self.cursor_group.add(self.cursor)
+        
+        # Create background and foreground, converted to the display format
+        self.background_surf = self.asset_manager.background_img.convert()
+        self.foreground_surf = self.asset_manager.foreground_img.convert_alpha()
+        self.background = StaticLayer(self.background_surf, (0, 0))
+        self.foreground = StaticLayer(self.foreground_surf,
+                                      (0, SCREEN_HEIGHT - self.foreground_surf.get_height()))
+        
+        self.draw_groups = (self.background, self.ducks,
+                            self.foreground, self.cursor_group)
         
-        # Create background and foreground
-        self.background = Background(self)
-        self.foreground = Foreground(self)
-        self.all_sprites.add(self.background)
-        self.all_sprites.add(self.foreground)
+        # Preallocate every duck (inert until spawned); spawning reuses them instead of allocating
+        self._duck_pool = [Duck(self, slot) for slot in range(MAX_DUCKS)]
+        self._free_ducks.extend(self._duck_pool)
         
     def start_game(self):
         """Start a new game"""
@@ -241,8 +390,9 @@ class GameEngine:
         self.ducks_shot = 0
         self.total_shots = 0
         self.total_ducks = 0
-        self.start_time = pygame.time.get_ticks()
+        self.elapsed = 0.0
         self.spawn_timer = 0
+        self._info_cache_valid = False
         
         # Clear existing ducks
         for duck in self.ducks:
@@ -255,6 +405,8 @@ class GameEngine:
         self.ducks_shot = 0
         self.total_shots = 0
         self.total_ducks = 0
+        self.elapsed = 0.0
+        self._info_cache_valid = False
         
         # Clear ducks
         for duck in self.ducks:
@@ -262,6 +414,7 @@ class GameEngine:
             
     def toggle_pause(self):
         """Toggle pause state"""
+        self._info_cache_valid = False
         if self.state == PLAYING:
             self.state = PAUSED
         elif self.state == PAUSED:
@@ -269,49 +422,153 @@ class GameEngine:
             
     def spawn_duck(self):
         """Spawn a new duck"""
-        colors = list(self.asset_manager.duck_sprites.keys())
-        weights = [0.5, 0.3, 0.2]  # Probability weights
-        color = random.choices(colors, weights=weights)[0]
+        if not self._free_ducks:
+            return
         
-        duck = Duck(self, color)
+        # Weighted pick against the precomputed cumulative weights
+        r = random.random()
+        for color, limit in zip(self._duck_colors, self._duck_color_cum):
+            if r < limit:
+                break
+        duck = self._free_ducks.popleft()
+        duck.reset(color)
+        self._duck_list.append(duck)
+        self._duck_rects.append(duck.rect)
         self.ducks.add(duck)
-        self.all_sprites.add(duck)
         self.total_ducks += 1
         
+    def ensure_duck_color(self, color_idx: int):
+        """Load a duck color's frames into duck_frames if this is its first use"""
+        if self.duck_frame_counts[color_idx, 0]:
+            return
+            
+        duck_sprites = self.asset_manager.get_duck_sprites(self._duck_colors[color_idx])
+        max_frames = max(len(duck_sprites[anim]) for anim in DUCK_ANIMATIONS)
+        if max_frames > self.duck_frames.shape[2]:
+            grown = np.empty(self.duck_frames.shape[:2] + (max_frames,), dtype=object)
+            grown[:, :, :self.duck_frames.shape[2]] = self.duck_frames
+            self.duck_frames = grown
+            
+        for a, anim in enumerate(DUCK_ANIMATIONS):
+            frames = duck_sprites[anim]
+            self.duck_frames[color_idx, a, :len(frames)] = frames
+            self.duck_frame_counts[color_idx, a] = len(frames)
+            
+    def random_vy(self) -> float:
+        """Return a random vertical speed in [-50, 50) from a batched pool"""
+        if self._rand_index >= len(self._rand_pool):
+            self._rand_pool = np.random.uniform(-50, 50, size=RAND_POOL_SIZE).astype(np.float32)
+            self._rand_index = 0
+        value = self._rand_pool[self._rand_index]
+        self._rand_index += 1
+        return value
+        
+    def release_duck(self, duck: Duck):
+        """Return a killed duck to the pool"""
+        index = self._duck_list.index(duck)
+        del self._duck_list[index]
+        del self._duck_rects[index]
+        self._free_ducks.append(duck)
+        
+    def _step_ducks(self, delta_time: float):
+        """Move every duck and bounce it off the screen edges in one vectorized pass"""
+        state = self.duck_state
+        x = state['x']
+        y = state['y']
+        w = state['w']
+        h = state['h']
+        
+        if HAS_NUMBA:
+            step_ducks(x, y, state['speed'], state['vy'], w, h, state['dir'],
+                       state['alive'], state['dying'], delta_time,
+                       SCREEN_WIDTH, SCREEN_HEIGHT)
+            return
+        
+        alive = state['alive']
+        if alive.any():
+            direction = state['dir']
+            vy = state['vy']
+            
+            # Move ducks
+            x[alive] += direction[alive] * state['speed'][alive] * delta_time
+            y[alive] += vy[alive] * delta_time
+            
+            # Bounce off screen edges
+            bounce_x = alive & ((x < -w) | (x > SCREEN_WIDTH))
+            if bounce_x.any():
+                direction[bounce_x] *= -1
+                x[bounce_x] = np.clip(x[bounce_x], -w[bounce_x], SCREEN_WIDTH)
+                
+            bounce_y = alive & ((y < 0) | (y + h > SCREEN_HEIGHT))
+            if bounce_y.any():
+                vy[bounce_y] *= -1
+                y[bounce_y] = np.clip(y[bounce_y], 0, SCREEN_HEIGHT - h[bounce_y])
+                
+        # Dying ducks fall down
+        dying = state['dying']
+        if dying.any():
+            y[dying] += 200 * delta_time
+        
+    def _sync_duck_rects(self):
+        """Write the float positions into the live ducks' integer rects, once per frame"""
+        state = self.duck_state
+        xs = state['x'].astype(np.int32).tolist()
+        ys = state['y'].astype(np.int32).tolist()
+        for duck in self._duck_list:
+            slot = duck.slot
+            duck.rect.topleft = (xs[slot], ys[slot])
+            
     def shoot(self, position: tuple):
         """Handle shooting at position"""
         self.total_shots += 1
+        self._info_cache_valid = False
         self.asset_manager.shot_sound.play()
         
         # Check for duck hits
-        for duck in self.ducks:
-            if duck.alive and duck.rect.collidepoint(position):
-                duck.hit()
-                self.score += duck.points
-                self.ducks_shot += 1
-                break
+        duck = self._find_hit_duck(position)
+        if duck is not None:
+            duck.hit()
+            self.score += duck.points
+            self.ducks_shot += 1
+            
+    def _find_hit_duck(self, position: tuple) -> Optional[Duck]:
+        """Return the first alive duck under position, if any"""
+        if HAS_NUMBA:
+            state = self.duck_state
+            slot = hit_test(int(position[0]), int(position[1]), state['x'], state['y'],
+                            state['w'], state['h'], state['alive'])
+            return self._duck_pool[slot] if slot >= 0 else None
+            
+        # Duck rects are updated in place, so the cached list is always current
+        duck_list = self._duck_list
+        for index in pygame.Rect(position, (1, 1)).collidelistall(self._duck_rects):
+            if duck_list[index].alive:
+                return duck_list[index]
+        return None
                 
     def update(self, delta_time: float):
         """Update game state"""
         if self.state != PLAYING:
             return
+        self._info_cache_valid = False
             
         # Update spawn timer
-        self.spawn_timer += delta_time * 1000
+        self.spawn_timer += delta_time
         if self.spawn_timer >= self.spawn_delay:
             self.spawn_duck()
             self.spawn_timer = 0
             
-        # Update all sprites except cursor
-        for sprite in self.all_sprites:
-            if isinstance(sprite, Cursor):
-                continue
-            sprite.update(delta_time)
+        # Advance duck physics for all ducks at once
+        self._step_ducks(delta_time)
+            
+        # Only ducks animate; background and foreground are static
+        self.ducks.update(delta_time)
+        self._sync_duck_rects()
         # El cursor se actualiza solo con update_cursor()
         
         # Check game time
-        current_time = pygame.time.get_ticks()
-        if current_time - self.start_time >= self.game_time:
+        self.elapsed += delta_time
+        if self.elapsed >= self.game_time:
             self.state = GAME_OVER
             
     def update_cursor(self, position: tuple):
@@ -321,19 +578,33 @@ class GameEngine:
             
     def get_game_info(self) -> Dict[str, Any]:
         """Get current game information"""
-        current_time = pygame.time.get_ticks()
-        time_remaining = max(0, self.game_time - (current_time - self.start_time))
-        
-        return {
-            "state": self.state,
-            "score": self.score,
-            "ducks_shot": self.ducks_shot,
-            "total_shots": self.total_shots,
-            "accuracy": (self.ducks_shot / max(1, self.total_shots)) * 100,
-            "time_remaining": time_remaining,
-            "total_ducks": self.total_ducks
-        }
-        
-    def get_sprites(self) -> pygame.sprite.LayeredUpdates:
-        """Get sprite group for rendering"""
-        return self.all_sprites 
\ No newline at end of file
+        if self._info_cache_valid:
+            return self._info_cache
+        self._info_cache_valid = True
+        
+        # Reported in milliseconds, as the HUD expects
+        time_remaining = max(0, int((self.game_time - self.elapsed) * 1000))
+        
+        # Refresh the same dict in place instead of allocating a new one
+        info = self._info_cache
+        info["state"] = self.state
+        info["score"] = self.score
+        info["ducks_shot"] = self.ducks_shot
+        info["total_shots"] = self.total_shots
+        info["accuracy"] = (self.ducks_shot / max(1, self.total_shots)) * 100
+        info["time_remaining"] = time_remaining
+        info["total_ducks"] = self.total_ducks
+        return info
+        
+    def get_dirty_rects(self) -> List[pygame.Rect]:
+        """Get screen areas covered by moving sprites last frame and this frame"""
+        # Image-sized, since animation frames (e.g. the die frames) can outgrow the duck's rect
+        current = [duck.image.get_rect(topleft=duck.rect.topleft) for duck in self._duck_list]
+        current.append(self.cursor.rect.copy())
+        dirty = self._prev_rects + current
+        self._prev_rects = current
+        return dirty
+        
+    def get_sprites(self) -> tuple:
+        """Get sprite groups for rendering, back to front"""
+        return self.draw_groups 
\ No newline at end of file
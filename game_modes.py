@@ -7,6 +7,22 @@ from enum import Enum
 import random
 import math
 
+# Challenge mode: available challenges and the extra rule each one adds
+_CHALLENGES = (
+    'inverted_controls',
+    'speed_boost',
+    'accuracy_required',
+    'limited_ammo',
+    'moving_targets'
+)
+_CHALLENGE_RULES = {
+    'inverted_controls': ('inverted_mouse', True),
+    'speed_boost': ('player_speed_boost', 2.0),
+    'accuracy_required': ('min_accuracy', 80),
+    'limited_ammo': ('ammo_limit', 5),
+    'moving_targets': ('target_speed_multiplier', 1.5)
+}
+
 class GameMode(Enum):
     """Available game modes"""
     CLASSIC = "classic"
@@ -28,9 +44,13 @@ class GameModeConfig:
         self.spawn_delay = spawn_delay
         self.ai_start_level = ai_start_level
         self.special_rules = special_rules
+        self._cached_description: Optional[str] = None
         
     def get_description(self) -> str:
-        """Get full description with rules"""
+        """Get full description with rules (built once, then cached)"""
+        if self._cached_description is not None:
+            return self._cached_description
+            
         desc = f"{self.description}\n\n"
         desc += f"⏱️ Duración: {self.duration // 1000}s" if self.duration > 0 else "⏱️ Duración: Infinita"
         desc += f"\n🎯 IA inicial: Nivel {self.ai_start_level}"
@@ -40,6 +60,7 @@ class GameModeConfig:
             for rule, value in self.special_rules.items():
                 desc += f"\n• {rule}: {value}"
                 
+        self._cached_description = desc
         return desc
 
 class GameModeManager:
@@ -50,6 +71,19 @@ class GameModeManager:
         self.current_mode = GameMode.CLASSIC
         self._init_modes()
         
+        # Mode -> rule setup / per-frame logic
+        self._apply_table = {
+            GameMode.SURVIVAL: self._apply_survival_rules,
+            GameMode.TIME_ATTACK: self._apply_time_attack_rules,
+            GameMode.PRECISION: self._apply_precision_rules,
+            GameMode.BOSS_RUSH: self._apply_boss_rush_rules,
+            GameMode.CHALLENGE: self._apply_challenge_rules
+        }
+        self._update_table = {
+            GameMode.SURVIVAL: self._update_survival_logic,
+            GameMode.CHALLENGE: self._update_challenge_logic
+        }
+        
     def _init_modes(self):
         """Initialize all game modes"""
         self.modes[GameMode.CLASSIC] = GameModeConfig(
@@ -139,13 +173,46 @@ class GameModeManager:
             }
         )
         
+        # Modes are fixed after init, so the UI list is built once
+        self._mode_list = tuple((mode, config.name, config.description)
+                                for mode, config in self.modes.items())
+        
+        # One persistent rules dict per mode, returned by apply_mode_rules (read-only for callers)
+        self._rules_cache: Dict[GameMode, Dict[str, Any]] = {
+            GameMode.SURVIVAL: {
+                'survival_mode': True,
+                'ai_increase_interval': 30000,  # 30 seconds
+                'ai_increase_amount': 1,
+                'speed_increase_factor': 1.1,
+                'time_bonus_points': 10  # Points per second survived
+            },
+            GameMode.TIME_ATTACK: {
+                'time_attack_mode': True,
+                'speed_bonus_multiplier': 2.0,
+                'rapid_spawn': True
+            },
+            GameMode.PRECISION: {
+                'precision_mode': True,
+                'max_shots': 10,
+                'precision_bonus': 2.0,
+                'miss_penalty': -50
+            },
+            GameMode.BOSS_RUSH: {
+                'boss_rush_mode': True,
+                'boss_health': 3,
+                'boss_size_multiplier': 2.0,
+                'boss_points': 500
+            },
+            GameMode.CHALLENGE: {}  # Refilled in place for every new challenge
+        }
+        
     def get_mode(self, mode: GameMode) -> Optional[GameModeConfig]:
         """Get configuration for a specific mode"""
         return self.modes.get(mode)
         
     def get_all_modes(self) -> Dict[GameMode, GameModeConfig]:
-        """Get all available modes"""
-        return self.modes.copy()
+        """Get all available modes (the shared dict; do not modify)"""
+        return self.modes
         
     def set_current_mode(self, mode: GameMode):
         """Set current game mode"""
@@ -159,7 +226,6 @@ class GameModeManager:
     def apply_mode_rules(self, game_engine) -> Dict[str, Any]:
         """Apply current mode rules to game engine"""
         config = self.get_current_mode()
-        rules = {}
         
         # Apply basic settings
         game_engine.game_time = config.duration
@@ -167,28 +233,12 @@ class GameModeManager:
         game_engine.ai_level = config.ai_start_level
         
         # Apply special rules based on mode
-        if self.current_mode == GameMode.SURVIVAL:
-            rules = self._apply_survival_rules(game_engine)
-        elif self.current_mode == GameMode.TIME_ATTACK:
-            rules = self._apply_time_attack_rules(game_engine)
-        elif self.current_mode == GameMode.PRECISION:
-            rules = self._apply_precision_rules(game_engine)
-        elif self.current_mode == GameMode.BOSS_RUSH:
-            rules = self._apply_boss_rush_rules(game_engine)
-        elif self.current_mode == GameMode.CHALLENGE:
-            rules = self._apply_challenge_rules(game_engine)
-            
-        return rules
+        apply_rules = self._apply_table.get(self.current_mode)
+        return apply_rules(game_engine) if apply_rules else {}
         
     def _apply_survival_rules(self, game_engine) -> Dict[str, Any]:
         """Apply survival mode rules"""
-        rules = {
-            'survival_mode': True,
-            'ai_increase_interval': 30000,  # 30 seconds
-            'ai_increase_amount': 1,
-            'speed_increase_factor': 1.1,
-            'time_bonus_points': 10  # Points per second survived
-        }
+        rules = self._rules_cache[GameMode.SURVIVAL]
         
         # Add survival-specific attributes to game engine
         game_engine.survival_timer = 0
@@ -198,22 +248,11 @@ class GameModeManager:
         
     def _apply_time_attack_rules(self, game_engine) -> Dict[str, Any]:
         """Apply time attack mode rules"""
-        rules = {
-            'time_attack_mode': True,
-            'speed_bonus_multiplier': 2.0,
-            'rapid_spawn': True
-        }
-        
-        return rules
+        return self._rules_cache[GameMode.TIME_ATTACK]
         
     def _apply_precision_rules(self, game_engine) -> Dict[str, Any]:
         """Apply precision mode rules"""
-        rules = {
-            'precision_mode': True,
-            'max_shots': 10,
-            'precision_bonus': 2.0,
-            'miss_penalty': -50
-        }
+        rules = self._rules_cache[GameMode.PRECISION]
         
         # Add precision-specific attributes
         game_engine.shots_remaining = 10
@@ -222,56 +261,31 @@ class GameModeManager:
         
     def _apply_boss_rush_rules(self, game_engine) -> Dict[str, Any]:
         """Apply boss rush mode rules"""
-        rules = {
-            'boss_rush_mode': True,
-            'boss_health': 3,
-            'boss_size_multiplier': 2.0,
-            'boss_points': 500
-        }
-        
-        return rules
+        return self._rules_cache[GameMode.BOSS_RUSH]
         
     def _apply_challenge_rules(self, game_engine) -> Dict[str, Any]:
         """Apply challenge mode rules"""
         # Random challenge selection
-        challenges = [
-            'inverted_controls',
-            'speed_boost',
-            'accuracy_required',
-            'limited_ammo',
-            'moving_targets'
-        ]
-        
-        selected_challenge = random.choice(challenges)
-        
-        rules = {
-            'challenge_mode': True,
-            'current_challenge': selected_challenge,
-            'challenge_duration': 15000  # 15 seconds per challenge
-        }
+        selected_challenge = _CHALLENGES[random.randrange(len(_CHALLENGES))]
+        
+        # Reuse the mode's rules dict, dropping the previous challenge's keys
+        rules = self._rules_cache[GameMode.CHALLENGE]
+        rules.clear()
+        rules['challenge_mode'] = True
+        rules['current_challenge'] = selected_challenge
+        rules['challenge_duration'] = 15000  # 15 seconds per challenge
         
         # Apply specific challenge
-        if selected_challenge == 'inverted_controls':
-            rules['inverted_mouse'] = True
-        elif selected_challenge == 'speed_boost':
-            rules['player_speed_boost'] = 2.0
-        elif selected_challenge == 'accuracy_required':
-            rules['min_accuracy'] = 80
-        elif selected_challenge == 'limited_ammo':
-            rules['ammo_limit'] = 5
-        elif selected_challenge == 'moving_targets':
-            rules['target_speed_multiplier'] = 1.5
+        key, value = _CHALLENGE_RULES[selected_challenge]
+        rules[key] = value
             
         return rules
         
     def update_mode_specific_logic(self, game_engine, delta_time: float):
         """Update mode-specific game logic"""
-        config = self.get_current_mode()
-        
-        if self.current_mode == GameMode.SURVIVAL:
-            self._update_survival_logic(game_engine, delta_time)
-        elif self.current_mode == GameMode.CHALLENGE:
-            self._update_challenge_logic(game_engine, delta_time)
+        update_logic = self._update_table.get(self.current_mode)
+        if update_logic:
+            update_logic(game_engine, delta_time)
             
     def _update_survival_logic(self, game_engine, delta_time: float):
         """Update survival mode logic"""
@@ -307,7 +321,6 @@ class GameModeManager:
             return config.get_description()
         return "Modo no disponible"
         
-    def get_mode_list(self) -> List[tuple]:
+    def get_mode_list(self) -> tuple:
         """Get list of modes for UI selection"""
-        return [(mode, config.name, config.description) 
-                for mode, config in self.modes.items()] 
\ No newline at end of file
+        return self._mode_list 
\ No newline at end of file
@@ -4,26 +4,107 @@ Handles hand gesture detection and maps gestures to game actions
 """
 import cv2
 import numpy as np
+import math
 import threading
 import time
 from typing import Optional, Tuple, Dict, Any
 
+# Optional JIT for the defect-counting kernel
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Segmentation runs on frames shrunk by this factor; contours are scaled back up
+DETECTION_SCALE = 2
+
+def _count_valid_defects_numpy(defects, contour) -> int:
+    """Count convexity defects with an angle of at most 90 degrees and enough depth"""
+    d = defects[:, 0]
+    points = contour[d[:, :3], 0].astype(np.float32)  # (N, 3, 2): start, end, far
+    starts = points[:, 0]
+    ends = points[:, 1]
+    fars = points[:, 2]
+    
+    # Calculate angles to filter real defects
+    a = np.linalg.norm(ends - starts, axis=1)
+    b = np.linalg.norm(fars - starts, axis=1)
+    c = np.linalg.norm(ends - fars, axis=1)
+    angle = np.arccos(np.clip((b**2 + c**2 - a**2) / (2*b*c + 1e-5), -1.0, 1.0))
+    
+    return int(((angle <= np.pi/2) & (d[:, 3] > 10000)).sum())
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def count_valid_defects(defects, contour):
+        """Scalar-loop version of _count_valid_defects_numpy (cheaper for a few dozen defects)"""
+        count = 0
+        for i in range(defects.shape[0]):
+            s = defects[i, 0, 0]
+            e = defects[i, 0, 1]
+            f = defects[i, 0, 2]
+            if defects[i, 0, 3] <= 10000:
+                continue
+                
+            sx = float(contour[s, 0, 0])
+            sy = float(contour[s, 0, 1])
+            ex = float(contour[e, 0, 0])
+            ey = float(contour[e, 0, 1])
+            fx = float(contour[f, 0, 0])
+            fy = float(contour[f, 0, 1])
+            
+            a = math.sqrt((ex - sx) ** 2 + (ey - sy) ** 2)
+            b = math.sqrt((fx - sx) ** 2 + (fy - sy) ** 2)
+            c = math.sqrt((ex - fx) ** 2 + (ey - fy) ** 2)
+            cos_angle = (b * b + c * c - a * a) / (2 * b * c + 1e-5)
+            cos_angle = min(1.0, max(-1.0, cos_angle))
+            
+            if math.acos(cos_angle) <= math.pi / 2:
+                count += 1
+        return count
+        
+    def warm_up_kernels():
+        """Compile count_valid_defects for OpenCV's int32 defect/contour arrays before the first frame"""
+        count_valid_defects(np.zeros((1, 1, 4), dtype=np.int32), np.zeros((1, 1, 2), dtype=np.int32))
+else:
+    count_valid_defects = _count_valid_defects_numpy
+
 class GestureController:
-    def __init__(self, camera_id: int = 0):
+    def __init__(self, camera_id: int = 0, debug: bool = False):
         self.camera_id = camera_id
         self.cap = None
         self.is_running = False
         self.thread = None
+        self._stop_event = threading.Event()
+        
+        # Show the OpenCV debug window (costs a frame copy and a 1 ms wait per frame)
+        self.debug = debug
         
         # Gesture detection parameters
         self.lower_skin = np.array([0, 20, 70], dtype=np.uint8)
         self.upper_skin = np.array([20, 255, 255], dtype=np.uint8)
+        self._kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
+        
+        # Run the segmentation chain through OpenCL (T-API) when a device is available
+        try:
+            self.use_opencl = cv2.ocl.haveOpenCL()
+            cv2.ocl.setUseOpenCL(self.use_opencl)
+        except (AttributeError, cv2.error):
+            self.use_opencl = False
         
+        if HAS_NUMBA:
+            warm_up_kernels()
+            
         # Current gesture state
         self.current_gesture = "none"
         self.hand_center = None
         self.gesture_confidence = 0.0
         
+        # Latest ((action, screen_pos, confidence), info) published by the detection thread
+        self._lock = threading.Lock()
+        self._latest = None
+        
         # Gesture mapping
         self.gesture_actions = {
             "open_hand": "move_cursor",
@@ -39,6 +120,8 @@ class GestureController:
         self.camera_width = 640
         self.camera_height = 480
         
+        self._publish("none", 0.0, None)
+        
     def start(self):
         """Start gesture detection in a separate thread"""
         if self.is_running:
@@ -52,13 +135,18 @@ class GestureController:
         self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.camera_width)
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.camera_height)
         
+        # Keep only the newest frame queued so detection never works on stale frames
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        
         self.is_running = True
+        self._stop_event.clear()
         self.thread = threading.Thread(target=self._detection_loop, daemon=True)
         self.thread.start()
         
     def stop(self):
         """Stop gesture detection"""
         self.is_running = False
+        self._stop_event.set()
         if self.thread:
             self.thread.join(timeout=1.0)
         if self.cap:
@@ -69,6 +157,9 @@ class GestureController:
         self.screen_width = width
         self.screen_height = height
         
+        # Re-map the last result with the new dimensions
+        self._publish(self.current_gesture, self.gesture_confidence, self.hand_center)
+        
     def get_hand_center(self, contour) -> Optional[Tuple[int, int]]:
         """Calculate the center of a hand contour"""
         M = cv2.moments(contour)
@@ -94,9 +185,13 @@ class GestureController:
         
         return (screen_x, screen_y)
         
-    def detect_gesture(self, contour) -> Tuple[str, float]:
-        """Detect gesture from hand contour"""
-        if contour is None or cv2.contourArea(contour) < 3000:
+    def detect_gesture(self, contour, area: Optional[float] = None) -> Tuple[str, float]:
+        """Detect gesture from hand contour (area may be passed in if already known)"""
+        if contour is None:
+            return "none", 0.0
+        if area is None:
+            area = cv2.contourArea(contour)
+        if area < 3000:
             return "none", 0.0
             
         # Calculate convex hull and defects
@@ -109,21 +204,7 @@ class GestureController:
             return "none", 0.0
             
         # Count valid defects
-        valid_defects = 0
-        for i in range(defects.shape[0]):
-            s, e, f, d = defects[i, 0]
-            start = tuple(contour[s][0])
-            end = tuple(contour[e][0])
-            far = tuple(contour[f][0])
-            
-            # Calculate angle to filter real defects
-            a = np.linalg.norm(np.array(end) - np.array(start))
-            b = np.linalg.norm(np.array(far) - np.array(start))
-            c = np.linalg.norm(np.array(end) - np.array(far))
-            angle = np.arccos((b**2 + c**2 - a**2) / (2*b*c + 1e-5))
-            
-            if angle <= np.pi/2 and d > 10000:
-                valid_defects += 1
+        valid_defects = count_valid_defects(defects, contour)
                 
         # Classify gesture based on defect count
         if valid_defects >= 4:
@@ -139,70 +220,91 @@ class GestureController:
             
     def _detection_loop(self):
         """Main detection loop running in separate thread"""
-        while self.is_running:
+        while not self._stop_event.is_set():
             ret, frame = self.cap.read()
             if not ret:
                 continue
                 
-            # Flip frame horizontally for mirror effect
-            frame = cv2.flip(frame, 1)
+            # Frames stay unmirrored; map_camera_to_screen flips X for the cursor
+            # Segment on a downscaled copy to cut the pixels each stage touches
+            src = cv2.UMat(frame) if self.use_opencl else frame
+            small = cv2.resize(src, None, fx=1 / DETECTION_SCALE, fy=1 / DETECTION_SCALE,
+                               interpolation=cv2.INTER_AREA)
             
             # Convert to HSV and segment skin
-            hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+            hsv = cv2.cvtColor(small, cv2.COLOR_BGR2HSV)
             mask = cv2.inRange(hsv, self.lower_skin, self.upper_skin)
             
-            # Apply morphological operations
-            mask = cv2.GaussianBlur(mask, (5, 5), 0)
-            mask = cv2.erode(mask, None, iterations=2)
-            mask = cv2.dilate(mask, None, iterations=2)
+            # Apply morphological operations (remove specks, then fill small holes)
+            mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, self._kernel)
+            mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, self._kernel)
+            
+            # Download the mask only once contours are needed
+            if self.use_opencl:
+                mask = mask.get()
             
             # Find contours
             contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
             
             if contours:
-                # Get largest contour (hand)
-                max_contour = max(contours, key=cv2.contourArea)
+                # Get largest contour (hand), back in full-frame coordinates
+                areas = [cv2.contourArea(contour) for contour in contours]
+                largest = max(range(len(areas)), key=areas.__getitem__)
+                max_contour = contours[largest] * DETECTION_SCALE
+                area = areas[largest] * DETECTION_SCALE * DETECTION_SCALE
                 
                 # Detect gesture
-                gesture, confidence = self.detect_gesture(max_contour)
+                gesture, confidence = self.detect_gesture(max_contour, area)
                 
                 # Get hand center
                 center = self.get_hand_center(max_contour)
                 
                 # Update state
-                self.current_gesture = gesture
-                self.gesture_confidence = confidence
-                self.hand_center = center
+                self._publish(gesture, confidence, center)
                 
                 # Draw debug info on frame
-                cv2.drawContours(frame, [max_contour], -1, (0, 255, 0), 2)
-                if center:
-                    cv2.circle(frame, center, 7, (255, 0, 0), -1)
-                    cv2.putText(frame, f'{gesture} ({confidence:.1f})', 
-                              (30, 60), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
+                if self.debug:
+                    cv2.drawContours(frame, [max_contour], -1, (0, 255, 0), 2)
+                    if center:
+                        cv2.circle(frame, center, 7, (255, 0, 0), -1)
             else:
-                self.current_gesture = "none"
-                self.gesture_confidence = 0.0
-                self.hand_center = None
-                
-            # Show debug window
-            cv2.imshow('Gesture Detection', frame)
-            if cv2.waitKey(1) & 0xFF == 27:  # ESC to exit
-                break
+                self._publish("none", 0.0, None)
                 
-        cv2.destroyAllWindows()
+            # Show debug window (mirrored for display only; label drawn after the flip)
+            if self.debug:
+                display = cv2.flip(frame, 1)
+                if self.hand_center:
+                    cv2.putText(display, f'{self.current_gesture} ({self.gesture_confidence:.1f})', 
+                              (30, 60), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
+                cv2.imshow('Gesture Detection', display)
+                if cv2.waitKey(1) & 0xFF == 27:  # ESC to exit
+                    self._stop_event.set()
+                    
+        if self.debug:
+            cv2.destroyAllWindows()
+        
+    def _publish(self, gesture: str, confidence: float, center: Optional[Tuple[int, int]]):
+        """Map a detection result to screen space once and replace the latest result in one step"""
+        screen_pos = self.map_camera_to_screen(center)
+        action = (self.gesture_actions.get(gesture, "none"), screen_pos, confidence)
+        info = {
+            "gesture": gesture,
+            "confidence": confidence,
+            "hand_center": center,
+            "screen_position": screen_pos
+        }
+        with self._lock:
+            self._latest = (action, info)
+        self.current_gesture = gesture
+        self.gesture_confidence = confidence
+        self.hand_center = center
         
     def get_current_action(self) -> Tuple[str, Tuple[int, int], float]:
         """Get current action based on detected gesture"""
-        action = self.gesture_actions.get(self.current_gesture, "none")
-        screen_pos = self.map_camera_to_screen(self.hand_center)
-        return action, screen_pos, self.gesture_confidence
+        with self._lock:
+            return self._latest[0]
         
     def get_gesture_info(self) -> Dict[str, Any]:
-        """Get detailed gesture information"""
-        return {
-            "gesture": self.current_gesture,
-            "confidence": self.gesture_confidence,
-            "hand_center": self.hand_center,
-            "screen_position": self.map_camera_to_screen(self.hand_center)
-        } 
\ No newline at end of file
+        """Get detailed gesture information (shared snapshot; do not modify)"""
+        with self._lock:
+            return self._latest[1] 
\ No newline at end of file
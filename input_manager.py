@@ -9,6 +9,19 @@ from gesture_controller import GestureController
 class InputManager:
     """Manages all input sources"""
     
+    # Key -> action flag set in handle_events
+    _KEY_ACTIONS = {
+        pygame.K_ESCAPE: 'quit',
+        pygame.K_RETURN: 'start_game',
+        pygame.K_p: 'pause',
+        pygame.K_r: 'reset',
+        pygame.K_h: 'toggle_help'
+    }
+    
+    # Minimum gesture confidence for actions, and the lower one for cursor movement
+    _MIN_CONF = 0.5
+    _CURSOR_MIN_CONF = 0.3
+    
     def __init__(self, gesture_controller: Optional[GestureController] = None):
         self.gesture_controller = gesture_controller
         self.use_gestures = gesture_controller is not None
@@ -23,6 +36,20 @@ class InputManager:
         self.gesture_cooldown = 0
         self.gesture_cooldown_time = 500  # milliseconds
         
+        # (action, screen_position, confidence) polled at most once per frame
+        self._gesture_cache = None
+        
+        # Actions dict returned by handle_events, reset and refilled every call
+        self._actions = {
+            'quit': False,
+            'start_game': False,
+            'pause': False,
+            'reset': False,
+            'toggle_help': False,
+            'shoot': False,
+            'cursor_position': self.mouse_position
+        }
+        
     def update(self, delta_time: float):
         """Update input state"""
         # Update gesture cooldown
@@ -33,16 +60,19 @@ class InputManager:
         self.mouse_clicked = False
         self.key_pressed = None
         
+        # Poll the gesture controller afresh next frame
+        self._gesture_cache = None
+        
     def handle_events(self, events) -> Dict[str, Any]:
-        """Handle pygame events and return input actions"""
-        actions = {
-            'quit': False,
-            'start_game': False,
-            'pause': False,
-            'reset': False,
-            'shoot': False,
-            'cursor_position': self.mouse_position
-        }
+        """Handle pygame events and return input actions (a reused dict; read it before the next call)"""
+        actions = self._actions
+        actions['quit'] = False
+        actions['start_game'] = False
+        actions['pause'] = False
+        actions['reset'] = False
+        actions['toggle_help'] = False
+        actions['shoot'] = False
+        actions['cursor_position'] = self.mouse_position
         
         for event in events:
             if event.type == pygame.QUIT:
@@ -51,14 +81,9 @@ class InputManager:
             elif event.type == pygame.KEYDOWN:
                 self.key_pressed = event.key
                 
-                if event.key == pygame.K_ESCAPE:
-                    actions['quit'] = True
-                elif event.key == pygame.K_RETURN:
-                    actions['start_game'] = True
-                elif event.key == pygame.K_p:
-                    actions['pause'] = True
-                elif event.key == pygame.K_r:
-                    actions['reset'] = True
+                action = self._KEY_ACTIONS.get(event.key)
+                if action:
+                    actions[action] = True
                     
             elif event.type == pygame.MOUSEMOTION:
                 self.mouse_position = event.pos
@@ -70,23 +95,32 @@ class InputManager:
                 
         # Handle gesture inputs if available
         if self.use_gestures and self.gesture_cooldown <= 0:
-            gesture_actions = self._handle_gesture_input()
-            actions.update(gesture_actions)
+            self._handle_gesture_input(actions)
             
         return actions
         
-    def _handle_gesture_input(self) -> Dict[str, Any]:
-        """Handle gesture-based input"""
+    def _poll_gesture(self) -> Tuple[str, Tuple[int, int], float]:
+        """Get the (action, position, confidence) gesture triple, polled once per frame"""
+        if self._gesture_cache is None:
+            if self.use_gestures and self.gesture_controller:
+                self._gesture_cache = self.gesture_controller.get_current_action()
+            else:
+                self._gesture_cache = ("none", self.mouse_position, 0.0)
+        return self._gesture_cache
+        
+    def _handle_gesture_input(self, actions: Dict[str, Any]):
+        """Handle gesture-based input, writing into actions"""
         if not self.gesture_controller:
-            return {}
+            return
             
-        action, position, confidence = self.gesture_controller.get_current_action()
+        action, position, confidence = self._poll_gesture()
         
         # Only process gestures with sufficient confidence
-        if confidence < 0.5:
-            return {'cursor_position': self.mouse_position}
+        if confidence < self._MIN_CONF:
+            actions['cursor_position'] = self.mouse_position
+            return
             
-        actions = {'cursor_position': position}
+        actions['cursor_position'] = position
         
         # Handle different gesture actions
         if action == "shoot" and self.last_gesture_action != "shoot":
@@ -106,14 +140,12 @@ class InputManager:
             
         elif action == "move_cursor":
             self.last_gesture_action = "move_cursor"
-            
-        return actions
         
     def get_cursor_position(self) -> Tuple[int, int]:
         """Get current cursor position"""
         if self.use_gestures and self.gesture_controller:
-            action, position, confidence = self.gesture_controller.get_current_action()
-            if confidence >= 0.3:  # Lower threshold for movement
+            action, position, confidence = self._poll_gesture()
+            if confidence >= self._CURSOR_MIN_CONF:  # Lower threshold for movement
                 return position
         return self.mouse_position
         
@@ -130,8 +162,8 @@ class InputManager:
         """Get current gesture action"""
         if not self.gesture_controller:
             return "none"
-        action, _, confidence = self.gesture_controller.get_current_action()
-        return action if confidence >= 0.5 else "none"
+        action, _, confidence = self._poll_gesture()
+        return action if confidence >= self._MIN_CONF else "none"
         
     def get_gesture_info(self) -> Optional[Dict[str, Any]]:
         """Get gesture detection information"""
@@ -143,8 +175,10 @@ class InputManager:
         """Enable gesture input"""
         self.gesture_controller = gesture_controller
         self.use_gestures = True
+        self._gesture_cache = None
         
     def disable_gestures(self):
         """Disable gesture input"""
         self.gesture_controller = None
-        self.use_gestures = False 
\ No newline at end of file
+        self.use_gestures = False
+        self._gesture_cache = None 
\ No newline at end of file
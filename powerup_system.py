@@ -4,7 +4,7 @@ Adds special abilities and temporary boosts to the game
 """
 import random
 import pygame
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Final, List, Any, Optional, Tuple
 from enum import Enum
 
 class PowerUpType(Enum):
@@ -17,17 +17,79 @@ class PowerUpType(Enum):
     MAGNET = "magnet"
     FREEZE = "freeze"
 
+# All power-up types, for random picks
+_POWERUP_TYPE_LIST: Final[Tuple[PowerUpType, ...]] = tuple(PowerUpType)
+
+# Power-up duration in milliseconds
+_POWERUP_DURATIONS: Final[Dict[PowerUpType, int]] = {
+    PowerUpType.RAPID_FIRE: 10000,      # 10 seconds
+    PowerUpType.DOUBLE_POINTS: 15000,   # 15 seconds
+    PowerUpType.SLOW_MOTION: 8000,      # 8 seconds
+    PowerUpType.MULTI_SHOT: 12000,      # 12 seconds
+    PowerUpType.SHIELD: 10000,          # 10 seconds
+    PowerUpType.MAGNET: 12000,          # 12 seconds
+    PowerUpType.FREEZE: 6000            # 6 seconds
+}
+
+# Multiplier applied while an effect is active (types not listed have none)
+_POWERUP_MULTIPLIERS: Final[Dict[PowerUpType, float]] = {
+    PowerUpType.RAPID_FIRE: 3.0,
+    PowerUpType.DOUBLE_POINTS: 2.0,
+    PowerUpType.SLOW_MOTION: 0.5
+}
+
+# Power-up icons
+_POWERUP_ICONS: Final[Dict[PowerUpType, str]] = {
+    PowerUpType.RAPID_FIRE: "⚡",
+    PowerUpType.DOUBLE_POINTS: "💰",
+    PowerUpType.SLOW_MOTION: "⏰",
+    PowerUpType.MULTI_SHOT: "🎯",
+    PowerUpType.SHIELD: "🛡️",
+    PowerUpType.MAGNET: "🧲",
+    PowerUpType.FREEZE: "❄️"
+}
+
+# Sprite background color based on type
+_POWERUP_COLORS: Final[Dict[PowerUpType, Tuple[int, int, int]]] = {
+    PowerUpType.RAPID_FIRE: (255, 165, 0),    # Orange
+    PowerUpType.DOUBLE_POINTS: (255, 215, 0), # Gold
+    PowerUpType.SLOW_MOTION: (0, 191, 255),   # Deep sky blue
+    PowerUpType.MULTI_SHOT: (255, 0, 255),    # Magenta
+    PowerUpType.SHIELD: (0, 255, 0),          # Green
+    PowerUpType.MAGNET: (128, 0, 128),        # Purple
+    PowerUpType.FREEZE: (173, 216, 230)       # Light blue
+}
+
+# Font for the power-up icons, created on first use
+_POWERUP_FONT: Optional[pygame.font.Font] = None
+
+def _get_font() -> pygame.font.Font:
+    """Get the shared power-up icon font, creating it on first call"""
+    global _POWERUP_FONT
+    if _POWERUP_FONT is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        _POWERUP_FONT = pygame.font.SysFont('Arial', 16)
+    return _POWERUP_FONT
+
+# Degrees between the pre-rotated frames of a power-up (10 -> 36 frames per type)
+ROTATION_STEP = 10
+
 class PowerUp(pygame.sprite.Sprite):
     """Power-up sprite that falls from the sky"""
     
+    # One pre-rendered surface per type, shared by every spawned power-up
+    _SURFACE_CACHE: Dict[PowerUpType, pygame.Surface] = {}
+    _ROTATION_CACHE: Dict[PowerUpType, Tuple[pygame.Surface, ...]] = {}
+    
     def __init__(self, powerup_type: PowerUpType, position: Tuple[int, int]):
         super().__init__()
         self.powerup_type = powerup_type
-        self.duration = self._get_duration()
-        self.icon = self._get_icon()
+        self.duration = _POWERUP_DURATIONS.get(powerup_type, 10000)
+        self.icon = _POWERUP_ICONS.get(powerup_type, "❓")
         
-        # Create visual representation
-        self.image = self._create_sprite()
+        # Visual representation (shared, never modified)
+        self.image = self._get_or_build_surface(powerup_type)
         self.rect = self.image.get_rect()
         self.rect.center = position
         
@@ -35,138 +97,144 @@ class PowerUp(pygame.sprite.Sprite):
         self.velocity_y = 50
         self.rotation = 0
         self.rotation_speed = 2
+        self._frames = self._ROTATION_CACHE[powerup_type]
+        self._frame_index = 0
+        self._center_y = float(self.rect.centery)  # sub-pixel fall position
         
-    def _get_duration(self) -> int:
-        """Get power-up duration in milliseconds"""
-        durations = {
-            PowerUpType.RAPID_FIRE: 10000,      # 10 seconds
-            PowerUpType.DOUBLE_POINTS: 15000,   # 15 seconds
-            PowerUpType.SLOW_MOTION: 8000,      # 8 seconds
-            PowerUpType.MULTI_SHOT: 12000,      # 12 seconds
-            PowerUpType.SHIELD: 10000,          # 10 seconds
-            PowerUpType.MAGNET: 12000,          # 12 seconds
-            PowerUpType.FREEZE: 6000            # 6 seconds
-        }
-        return durations.get(self.powerup_type, 10000)
-        
-    def _get_icon(self) -> str:
-        """Get power-up icon"""
-        icons = {
-            PowerUpType.RAPID_FIRE: "⚡",
-            PowerUpType.DOUBLE_POINTS: "💰",
-            PowerUpType.SLOW_MOTION: "⏰",
-            PowerUpType.MULTI_SHOT: "🎯",
-            PowerUpType.SHIELD: "🛡️",
-            PowerUpType.MAGNET: "🧲",
-            PowerUpType.FREEZE: "❄️"
-        }
-        return icons.get(self.powerup_type, "❓")
-        
-    def _create_sprite(self) -> pygame.Surface:
-        """Create power-up sprite surface"""
+    @classmethod
+    def _get_or_build_surface(cls, powerup_type: PowerUpType) -> pygame.Surface:
+        """Get the cached sprite surface for a power-up type, building it on first use"""
+        surface = cls._SURFACE_CACHE.get(powerup_type)
+        if surface is not None:
+            return surface
+            
         # Create a colored circle with icon
         size = 32
         surface = pygame.Surface((size, size), pygame.SRCALPHA)
-        
-        # Background color based on type
-        colors = {
-            PowerUpType.RAPID_FIRE: (255, 165, 0),    # Orange
-            PowerUpType.DOUBLE_POINTS: (255, 215, 0), # Gold
-            PowerUpType.SLOW_MOTION: (0, 191, 255),   # Deep sky blue
-            PowerUpType.MULTI_SHOT: (255, 0, 255),    # Magenta
-            PowerUpType.SHIELD: (0, 255, 0),          # Green
-            PowerUpType.MAGNET: (128, 0, 128),        # Purple
-            PowerUpType.FREEZE: (173, 216, 230)       # Light blue
-        }
-        
-        color = colors.get(self.powerup_type, (128, 128, 128))
+        color = _POWERUP_COLORS.get(powerup_type, (128, 128, 128))
         
         # Draw circle
         pygame.draw.circle(surface, color, (size//2, size//2), size//2)
         pygame.draw.circle(surface, (255, 255, 255), (size//2, size//2), size//2, 2)
         
         # Add icon (simplified - just text)
-        font = pygame.font.SysFont('Arial', 16)
-        text = font.render(self.icon, True, (255, 255, 255))
+        text = _get_font().render(_POWERUP_ICONS.get(powerup_type, "❓"), True, (255, 255, 255))
         text_rect = text.get_rect(center=(size//2, size//2))
         surface.blit(text, text_rect)
         
+        # Match the display format for fast blits (needs a display mode set)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+            
+        cls._SURFACE_CACHE[powerup_type] = surface
+        
+        # Pre-rotated copies so spinning never calls pygame.transform per frame
+        cls._ROTATION_CACHE[powerup_type] = tuple(
+            pygame.transform.rotozoom(surface, angle, 1.0) for angle in range(0, 360, ROTATION_STEP))
         return surface
         
-    def update(self, delta_time: float):
+    def update(self, delta_time: float, screen_height: int = 480):
         """Update power-up physics"""
+        rect = self.rect
+        
         # Fall down
-        self.rect.y += self.velocity_y * delta_time
+        center_y = self._center_y + self.velocity_y * delta_time
+        self._center_y = center_y
+        rect.centery = center_y
         
-        # Rotate
-        self.rotation += self.rotation_speed
-        if self.rotation >= 360:
-            self.rotation = 0
-            
         # Remove if off screen
-        if self.rect.top > 480:
+        if rect.top > screen_height:
             self.kill()
+            return
+            
+        # Rotate only while visible (power-ups spawn above the top edge)
+        if rect.bottom >= 0:
+            rotation = (self.rotation + self.rotation_speed) % 360
+            self.rotation = rotation
+            frame_index = rotation // ROTATION_STEP
+            if frame_index != self._frame_index:
+                self._frame_index = frame_index
+                self.image = self._frames[frame_index]
+                self.rect = self.image.get_rect(center=(rect.centerx, center_y))
 
 class PowerUpEffect:
     """Represents an active power-up effect"""
     
-    def __init__(self, powerup_type: PowerUpType, duration: int):
+    __slots__ = ('powerup_type', 'duration', 'expiry', 'active')
+    
+    def __init__(self, powerup_type: PowerUpType, duration: int, start_ms: int = 0):
         self.powerup_type = powerup_type
         self.duration = duration
-        self.remaining_time = duration
+        self.expiry = start_ms + duration  # on the PowerUpSystem clock, in ms
         self.active = True
         
-    def update(self, delta_time: float):
-        """Update effect timer"""
-        self.remaining_time -= delta_time * 1000
-        if self.remaining_time <= 0:
-            self.active = False
-            
-    def get_remaining_percentage(self) -> float:
+    def get_remaining_percentage(self, now_ms: int) -> float:
         """Get remaining time as percentage"""
-        return max(0.0, self.remaining_time / self.duration)
+        return max(0.0, (self.expiry - now_ms) / self.duration)
 
 class PowerUpSystem:
     """Main power-up system"""
     
-    def __init__(self, game_engine):
+    # Duck class -> whether it supports freeze()/unfreeze(), checked once per class
+    _FREEZABLE_TYPES: Dict[type, bool] = {}
+    
+    def __init__(self, game_engine, screen_height: int = 480):
         self.game_engine = game_engine
-        self.active_effects: List[PowerUpEffect] = []
+        self._screen_h = screen_height
+        self.active_effects: Dict[PowerUpType, PowerUpEffect] = {}  # at most one per type
         self.powerup_sprites = pygame.sprite.Group()
         
+        # Integer ms clock advanced once per update (stands still while the game is paused)
+        self.clock_ms = 0
+        
         # Spawn settings
-        self.spawn_timer = 0
         self.spawn_delay = 15000  # 15 seconds between power-ups
         self.spawn_chance = 0.3   # 30% chance when timer expires
+        self.next_spawn_ms = self.spawn_delay
+        
+        # Multipliers of the active effects, updated on apply/remove
+        self._multipliers: Dict[PowerUpType, float] = {}
+        
+    @property
+    def rapid_fire_multiplier(self) -> float:
+        """Fire rate multiplier (rapid fire)"""
+        return self._multipliers.get(PowerUpType.RAPID_FIRE, 1.0)
+        
+    @property
+    def points_multiplier(self) -> float:
+        """Score multiplier (double points)"""
+        return self._multipliers.get(PowerUpType.DOUBLE_POINTS, 1.0)
         
-        # Effect multipliers
-        self.rapid_fire_multiplier = 1.0
-        self.points_multiplier = 1.0
-        self.time_scale = 1.0
+    @property
+    def time_scale(self) -> float:
+        """Duck time scale (slow motion)"""
+        return self._multipliers.get(PowerUpType.SLOW_MOTION, 1.0)
         
     def update(self, delta_time: float):
         """Update power-up system"""
-        # Update active effects
-        for effect in self.active_effects[:]:
-            effect.update(delta_time)
-            if not effect.active:
-                self.active_effects.remove(effect)
-                self._remove_effect(effect.powerup_type)
+        now = self.clock_ms = self.clock_ms + round(delta_time * 1000)
+        
+        # Expire active effects
+        if self.active_effects:
+            expired = [powerup_type for powerup_type, effect in self.active_effects.items()
+                       if now >= effect.expiry]
+            for powerup_type in expired:
+                self.active_effects.pop(powerup_type).active = False
+                self._remove_effect(powerup_type)
                 
-        # Update power-up sprites
-        self.powerup_sprites.update(delta_time)
+        # Update power-up sprites (those below the screen are killed)
+        if self.powerup_sprites:
+            self.powerup_sprites.update(delta_time, self._screen_h)
         
         # Spawn new power-ups
-        self.spawn_timer += delta_time * 1000
-        if self.spawn_timer >= self.spawn_delay:
+        if now >= self.next_spawn_ms:
             if random.random() < self.spawn_chance:
                 self.spawn_powerup()
-            self.spawn_timer = 0
+            self.next_spawn_ms = now + self.spawn_delay
             
     def spawn_powerup(self):
         """Spawn a random power-up"""
-        powerup_types = list(PowerUpType)
-        powerup_type = random.choice(powerup_types)
+        powerup_type = random.choice(_POWERUP_TYPE_LIST)
         
         # Random position at top of screen
         x = random.randint(50, 590)
@@ -190,78 +258,73 @@ class PowerUpSystem:
     def _apply_effect(self, powerup_type: PowerUpType, duration: int):
         """Apply power-up effect"""
         # Remove existing effect of same type
-        for effect in self.active_effects[:]:
-            if effect.powerup_type == powerup_type:
-                self.active_effects.remove(effect)
-                self._remove_effect(powerup_type)
+        if powerup_type in self.active_effects:
+            del self.active_effects[powerup_type]
+            self._remove_effect(powerup_type)
                 
         # Add new effect
-        effect = PowerUpEffect(powerup_type, duration)
-        self.active_effects.append(effect)
+        self.active_effects[powerup_type] = PowerUpEffect(powerup_type, duration, self.clock_ms)
         
         # Apply immediate effect
-        if powerup_type == PowerUpType.RAPID_FIRE:
-            self.rapid_fire_multiplier = 3.0
-        elif powerup_type == PowerUpType.DOUBLE_POINTS:
-            self.points_multiplier = 2.0
-        elif powerup_type == PowerUpType.SLOW_MOTION:
-            self.time_scale = 0.5
+        if powerup_type in _POWERUP_MULTIPLIERS:
+            self._multipliers[powerup_type] = _POWERUP_MULTIPLIERS[powerup_type]
         elif powerup_type == PowerUpType.FREEZE:
             self._freeze_ducks()
             
     def _remove_effect(self, powerup_type: PowerUpType):
         """Remove power-up effect"""
-        if powerup_type == PowerUpType.RAPID_FIRE:
-            self.rapid_fire_multiplier = 1.0
-        elif powerup_type == PowerUpType.DOUBLE_POINTS:
-            self.points_multiplier = 1.0
-        elif powerup_type == PowerUpType.SLOW_MOTION:
-            self.time_scale = 1.0
-        elif powerup_type == PowerUpType.FREEZE:
+        self._multipliers.pop(powerup_type, None)
+        if powerup_type == PowerUpType.FREEZE:
             self._unfreeze_ducks()
             
+    def _freezable_ducks(self) -> List[pygame.sprite.Sprite]:
+        """Get the ducks whose class supports freezing"""
+        freezable = self._FREEZABLE_TYPES
+        ducks = []
+        for duck in self.game_engine.ducks:
+            duck_type = type(duck)
+            can_freeze = freezable.get(duck_type)
+            if can_freeze is None:
+                can_freeze = hasattr(duck_type, 'freeze') and hasattr(duck_type, 'unfreeze')
+                freezable[duck_type] = can_freeze
+            if can_freeze:
+                ducks.append(duck)
+        return ducks
+        
     def _freeze_ducks(self):
         """Freeze all ducks temporarily"""
-        for duck in self.game_engine.ducks:
-            if hasattr(duck, 'freeze'):
-                duck.freeze()
+        for duck in self._freezable_ducks():
+            duck.freeze()
                 
     def _unfreeze_ducks(self):
         """Unfreeze all ducks"""
-        for duck in self.game_engine.ducks:
-            if hasattr(duck, 'unfreeze'):
-                duck.unfreeze()
+        for duck in self._freezable_ducks():
+            duck.unfreeze()
                 
     def get_active_effects(self) -> List[PowerUpEffect]:
         """Get list of active effects"""
-        return self.active_effects
+        return list(self.active_effects.values())
         
     def has_effect(self, powerup_type: PowerUpType) -> bool:
         """Check if a specific effect is active"""
-        return any(effect.powerup_type == powerup_type and effect.active 
-                  for effect in self.active_effects)
+        effect = self.active_effects.get(powerup_type)
+        return effect is not None and effect.active
                   
     def get_effect_multiplier(self, powerup_type: PowerUpType) -> float:
         """Get multiplier for a specific effect"""
-        for effect in self.active_effects:
-            if effect.powerup_type == powerup_type and effect.active:
-                if powerup_type == PowerUpType.RAPID_FIRE:
-                    return self.rapid_fire_multiplier
-                elif powerup_type == PowerUpType.DOUBLE_POINTS:
-                    return self.points_multiplier
-                elif powerup_type == PowerUpType.SLOW_MOTION:
-                    return self.time_scale
-        return 1.0
+        return self._multipliers.get(powerup_type, 1.0)
         
     def get_sprites(self) -> pygame.sprite.Group:
         """Get power-up sprites for rendering"""
         return self.powerup_sprites
         
+    def draw(self, screen: pygame.Surface):
+        """Draw the falling power-ups"""
+        self.powerup_sprites.draw(screen)
+        
     def reset(self):
         """Reset power-up system"""
         self.active_effects.clear()
         self.powerup_sprites.empty()
-        self.spawn_timer = 0
-        self.rapid_fire_multiplier = 1.0
-        self.points_multiplier = 1.0
-        self.time_scale = 1.0 
\ No newline at end of file
+        self.next_spawn_ms = self.clock_ms + self.spawn_delay
+        self._multipliers.clear() 
\ No newline at end of file
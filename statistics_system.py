@@ -2,16 +2,104 @@
 Statistics and Leaderboard System for PyHunt
 Tracks player performance and maintains leaderboards
 """
+import heapq
 import json
 import os
+import time
+from collections import deque
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
-import statistics
+from dataclasses import dataclass, field
+import numpy as np
+
+# Optional JIT for the trend regression
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Fast JSON encoding/decoding for the stats files (orjson is optional)
+try:
+    import orjson
+    
+    def _dumps(data: Any, indent: bool = False) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+        
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(data: Any, indent: bool = False) -> bytes:
+        return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+        
+    _loads = json.loads
+
+def _atomic_write(path: str, data: bytes):
+    """Write a file via a temporary sibling and os.replace, so readers never see a partial file"""
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+def _decode_session_lines(lines) -> List[Dict[str, Any]]:
+    """Decode session log lines, skipping any that are corrupt"""
+    records = []
+    for line in lines:
+        try:
+            data = _loads(line)
+        except ValueError:
+            continue
+        if isinstance(data, dict) and data.keys() == _SESSION_FIELDS:
+            records.append(data)
+    return records
+
+# Append-only session log (one JSON object per line) and the older whole-list file it replaces
+SESSIONS_LOG = 'game_sessions.jsonl'
+LEGACY_SESSIONS_FILE = 'game_sessions.json'
+
+# Most recent sessions loaded at startup; lifetime totals live in PlayerStats
+SESSION_WINDOW = 1000
+
+# Entries kept per leaderboard
+LEADERBOARD_SIZE = 100
+
+# Minimum seconds between writes of the stats and leaderboard files (flush() forces one; the game calls it on exit)
+SAVE_INTERVAL = 2.0
+
+# Per-session columns mirrored into NumPy arrays for the reporting queries
+_SESSION_COLUMNS = {
+    'score': np.int64,
+    'accuracy': np.float64,
+    'ducks_shot': np.int64,
+    'duration': np.int64,
+    'mode_idx': np.int8,
+    'ts': 'datetime64[s]'
+}
+
+def _slope(x, y):
+    """Least-squares slope of y against x, in a single pass"""
+    n = x.shape[0]
+    sum_x = 0.0
+    sum_y = 0.0
+    sum_xy = 0.0
+    sum_x2 = 0.0
+    for i in range(n):
+        xi = x[i]
+        yi = y[i]
+        sum_x += xi
+        sum_y += yi
+        sum_xy += xi * yi
+        sum_x2 += xi * xi
+    return (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
+
+if HAS_NUMBA:
+    _slope = njit(cache=True, fastmath=True)(_slope)
 
 @dataclass
 class GameSession:
     """Represents a single game session"""
+    __slots__ = ('timestamp', 'mode', 'score', 'ducks_shot', 'total_shots', 'accuracy',
+                 'time_remaining', 'ai_level', 'duration')
+    
     timestamp: str
     mode: str
     score: int
@@ -23,12 +111,25 @@ class GameSession:
     duration: int  # Actual game duration in seconds
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            'timestamp': self.timestamp,
+            'mode': self.mode,
+            'score': self.score,
+            'ducks_shot': self.ducks_shot,
+            'total_shots': self.total_shots,
+            'accuracy': self.accuracy,
+            'time_remaining': self.time_remaining,
+            'ai_level': self.ai_level,
+            'duration': self.duration
+        }
         
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'GameSession':
         return cls(**data)
 
+# Keys of a session record, for validating log lines before building GameSession from them
+_SESSION_FIELDS = frozenset(GameSession.__slots__)
+
 @dataclass
 class PlayerStats:
     """Player statistics summary"""
@@ -47,9 +148,27 @@ class PlayerStats:
     longest_streak: int
     achievements_unlocked: int
     total_achievement_points: int
+    mode_counts: Dict[str, int] = field(default_factory=dict)  # games played per mode
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            'total_games': self.total_games,
+            'total_score': self.total_score,
+            'total_ducks_shot': self.total_ducks_shot,
+            'total_shots': self.total_shots,
+            'best_score': self.best_score,
+            'best_accuracy': self.best_accuracy,
+            'best_ducks_shot': self.best_ducks_shot,
+            'average_score': self.average_score,
+            'average_accuracy': self.average_accuracy,
+            'total_play_time': self.total_play_time,
+            'favorite_mode': self.favorite_mode,
+            'current_streak': self.current_streak,
+            'longest_streak': self.longest_streak,
+            'achievements_unlocked': self.achievements_unlocked,
+            'total_achievement_points': self.total_achievement_points,
+            'mode_counts': dict(self.mode_counts)
+        }
         
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'PlayerStats':
@@ -58,6 +177,8 @@ class PlayerStats:
 @dataclass
 class LeaderboardEntry:
     """Leaderboard entry"""
+    __slots__ = ('rank', 'player_name', 'score', 'mode', 'timestamp', 'accuracy', 'ducks_shot')
+    
     rank: int
     player_name: str
     score: int
@@ -67,7 +188,15 @@ class LeaderboardEntry:
     ducks_shot: int
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            'rank': self.rank,
+            'player_name': self.player_name,
+            'score': self.score,
+            'mode': self.mode,
+            'timestamp': self.timestamp,
+            'accuracy': self.accuracy,
+            'ducks_shot': self.ducks_shot
+        }
         
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'LeaderboardEntry':
@@ -79,8 +208,29 @@ class StatisticsSystem:
     def __init__(self):
         self.sessions: List[GameSession] = []
         self.player_stats: Optional[PlayerStats] = None
-        self.leaderboards: Dict[str, List[LeaderboardEntry]] = {}
+        # Bounded min-heaps of (score, accuracy, -seq, entry); older entries win ties
+        self.leaderboards: Dict[str, List[Tuple[int, float, int, LeaderboardEntry]]] = {}
+        self._leaderboard_seq = 0
+        
+        # Session fields as columns (see _SESSION_COLUMNS), filled up to _session_count
+        self._arr: Dict[str, np.ndarray] = {}
+        self._session_count = 0
+        
+        # Interned game modes: mode_idx in the columns indexes _mode_table
+        self._mode_id: Dict[str, int] = {}
+        self._mode_table: List[str] = []
+        
+        # Whether self.sessions is in timestamp order (true unless loaded data was not)
+        self._sessions_sorted = True
         
+        # Files with unsaved changes, and when they were last written
+        self._dirty = {'stats': False, 'boards': False}
+        self._last_flush = 0.0
+        
+        # Compile the trend regression now rather than on the first stats query
+        if HAS_NUMBA:
+            _slope(np.arange(2, dtype=np.float64), np.zeros(2, dtype=np.float64))
+            
         # Load existing data
         self.load_data()
         
@@ -88,6 +238,12 @@ class StatisticsSystem:
         if not self.player_stats:
             self.player_stats = self._create_empty_stats()
             
+        # Rebuild per-mode game counts once for stats saved without them
+        if not self.player_stats.mode_counts and self.sessions:
+            mode_counts = self.player_stats.mode_counts
+            for s in self.sessions:
+                mode_counts[s.mode] = mode_counts.get(s.mode, 0) + 1
+            
     def _create_empty_stats(self) -> PlayerStats:
         """Create empty player statistics"""
         return PlayerStats(
@@ -125,11 +281,55 @@ class StatisticsSystem:
             duration=duration
         )
         
+        if self.sessions and self.sessions[-1].timestamp > session.timestamp:
+            self._sessions_sorted = False
         self.sessions.append(session)
+        self._append_session_columns(session)
+        with open(SESSIONS_LOG, 'ab') as f:
+            f.write(_dumps(session.to_dict()) + b'\n')
         self._update_player_stats(session)
         self._update_leaderboards(session)
         self.save_data()
         
+    def _rebuild_session_columns(self):
+        """Rebuild the session column arrays from self.sessions"""
+        self._session_count = 0
+        capacity = max(64, len(self.sessions))
+        self._arr = {name: np.zeros(capacity, dtype=dtype) for name, dtype in _SESSION_COLUMNS.items()}
+        for session in self.sessions:
+            self._append_session_columns(session)
+            
+    def _append_session_columns(self, session: GameSession):
+        """Append one session to the column arrays, doubling their capacity when full"""
+        arr = self._arr
+        i = self._session_count
+        if i >= len(arr['score']):
+            for name in arr:
+                arr[name] = np.concatenate((arr[name], np.zeros_like(arr[name])))
+                
+        mode_idx = self._mode_code(session.mode)
+        session.mode = self._mode_table[mode_idx]
+        arr['score'][i] = session.score
+        arr['accuracy'][i] = session.accuracy
+        arr['ducks_shot'][i] = session.ducks_shot
+        arr['duration'][i] = session.duration
+        arr['mode_idx'][i] = mode_idx
+        arr['ts'][i] = np.datetime64(session.timestamp, 's')
+        self._session_count = i + 1
+        
+    def _mode_code(self, mode: str) -> int:
+        """Get the small-int code of a game mode, interning it on first use"""
+        code = self._mode_id.get(mode)
+        if code is None:
+            code = len(self._mode_table)
+            self._mode_id[mode] = code
+            self._mode_table.append(mode)
+        return code
+        
+    def _column(self, name: str) -> np.ndarray:
+        """Get the filled part of a session column"""
+        return self._arr[name][:self._session_count]
+        
     def _update_player_stats(self, session: GameSession):
         """Update player statistics with new session"""
         stats = self.player_stats
@@ -154,14 +354,13 @@ class StatisticsSystem:
         stats.average_accuracy = (stats.total_ducks_shot / max(1, stats.total_shots)) * 100
         
         # Favorite mode
-        mode_counts = {}
-        for s in self.sessions:
-            mode_counts[s.mode] = mode_counts.get(s.mode, 0) + 1
-        if mode_counts:
-            stats.favorite_mode = max(mode_counts, key=mode_counts.get)
+        mode_counts = stats.mode_counts
+        mode_counts[session.mode] = mode_counts.get(session.mode, 0) + 1
+        stats.favorite_mode = max(mode_counts, key=mode_counts.get)
             
         # Streak calculation
         self._update_streaks(session)
+        self._dirty['stats'] = True
         
     def _update_streaks(self, session: GameSession):
         """Update win/loss streaks"""
@@ -177,53 +376,44 @@ class StatisticsSystem:
             
     def _update_leaderboards(self, session: GameSession):
         """Update leaderboards with new session"""
-        # Overall leaderboard
-        if 'overall' not in self.leaderboards:
-            self.leaderboards['overall'] = []
+        # Overall leaderboard, then the mode-specific one
+        for leaderboard_name in ('overall', session.mode):
+            entry = LeaderboardEntry(
+                rank=0,  # Assigned when the leaderboard is read
+                player_name="Player",  # Could be configurable
+                score=session.score,
+                mode=session.mode,
+                timestamp=session.timestamp,
+                accuracy=session.accuracy,
+                ducks_shot=session.ducks_shot
+            )
+            if self._push_leaderboard_entry(leaderboard_name, entry):
+                self._dirty['boards'] = True
             
-        entry = LeaderboardEntry(
-            rank=0,  # Will be calculated
-            player_name="Player",  # Could be configurable
-            score=session.score,
-            mode=session.mode,
-            timestamp=session.timestamp,
-            accuracy=session.accuracy,
-            ducks_shot=session.ducks_shot
-        )
-        
-        self.leaderboards['overall'].append(entry)
-        
-        # Mode-specific leaderboard
-        if session.mode not in self.leaderboards:
-            self.leaderboards[session.mode] = []
+    def _push_leaderboard_entry(self, leaderboard_name: str, entry: LeaderboardEntry) -> bool:
+        """Insert an entry into a leaderboard heap, dropping the lowest once it is full; False if it did not place"""
+        heap = self.leaderboards.setdefault(leaderboard_name, [])
+        item = (entry.score, entry.accuracy, -self._leaderboard_seq, entry)
+        self._leaderboard_seq += 1
+        if len(heap) < LEADERBOARD_SIZE:
+            heapq.heappush(heap, item)
+            return True
+        return heapq.heappushpop(heap, item) is not item
             
-        mode_entry = LeaderboardEntry(
-            rank=0,
-            player_name="Player",
-            score=session.score,
-            mode=session.mode,
-            timestamp=session.timestamp,
-            accuracy=session.accuracy,
-            ducks_shot=session.ducks_shot
-        )
-        
-        self.leaderboards[session.mode].append(mode_entry)
-        
-        # Sort and rank leaderboards
-        self._sort_leaderboards()
-        
-    def _sort_leaderboards(self):
-        """Sort all leaderboards by score and assign ranks"""
-        for leaderboard_name, entries in self.leaderboards.items():
-            # Sort by score (descending), then by accuracy (descending)
-            entries.sort(key=lambda x: (x.score, x.accuracy), reverse=True)
-            
-            # Assign ranks
-            for i, entry in enumerate(entries):
-                entry.rank = i + 1
-                
-            # Keep only top 100 entries
-            self.leaderboards[leaderboard_name] = entries[:100]
+    def _ranked_entries(self, leaderboard_name: str, limit: Optional[int] = None) -> List[LeaderboardEntry]:
+        """Get a leaderboard's entries best first, with ranks assigned"""
+        heap = self.leaderboards.get(leaderboard_name, [])
+        # Sort by score (descending), then by accuracy (descending)
+        if limit is None:
+            items = sorted(heap, reverse=True)
+        else:
+            items = heapq.nlargest(limit, heap)
+        entries = []
+        for i, item in enumerate(items):
+            entry = item[3]
+            entry.rank = i + 1
+            entries.append(entry)
+        return entries
             
     def get_player_stats(self) -> PlayerStats:
         """Get current player statistics"""
@@ -231,34 +421,36 @@ class StatisticsSystem:
         
     def get_leaderboard(self, mode: str = "overall", limit: int = 10) -> List[LeaderboardEntry]:
         """Get leaderboard for specific mode"""
-        if mode not in self.leaderboards:
-            return []
-        return self.leaderboards[mode][:limit]
+        return self._ranked_entries(mode, limit)
         
     def get_recent_games(self, limit: int = 10) -> List[GameSession]:
         """Get recent game sessions"""
+        if self._sessions_sorted:
+            return self.sessions[-limit:][::-1] if limit > 0 else []
         return sorted(self.sessions, key=lambda x: x.timestamp, reverse=True)[:limit]
         
     def get_mode_stats(self, mode: str) -> Dict[str, Any]:
-        """Get statistics for a specific game mode"""
-        mode_sessions = [s for s in self.sessions if s.mode == mode]
-        
-        if not mode_sessions:
+        """Get statistics for a specific game mode over the loaded sessions (see SESSION_WINDOW)"""
+        code = self._mode_id.get(mode)
+        if code is None:
             return {}
             
-        scores = [s.score for s in mode_sessions]
-        accuracies = [s.accuracy for s in mode_sessions]
-        ducks_shot = [s.ducks_shot for s in mode_sessions]
+        mask = self._column('mode_idx') == code
+        if not mask.any():
+            return {}
+        scores = self._column('score')[mask]
+        accuracies = self._column('accuracy')[mask]
+        ducks_shot = self._column('ducks_shot')[mask]
         
         return {
-            'total_games': len(mode_sessions),
-            'average_score': statistics.mean(scores),
-            'best_score': max(scores),
-            'average_accuracy': statistics.mean(accuracies),
-            'best_accuracy': max(accuracies),
-            'total_ducks_shot': sum(ducks_shot),
-            'best_ducks_shot': max(ducks_shot),
-            'total_play_time': sum(s.duration for s in mode_sessions)
+            'total_games': int(mask.sum()),
+            'average_score': float(scores.mean()),
+            'best_score': int(scores.max()),
+            'average_accuracy': float(accuracies.mean()),
+            'best_accuracy': float(accuracies.max()),
+            'total_ducks_shot': int(ducks_shot.sum()),
+            'best_ducks_shot': int(ducks_shot.max()),
+            'total_play_time': int(self._column('duration')[mask].sum())
         }
         
     def get_daily_stats(self, days: int = 7) -> List[Dict[str, Any]]:
@@ -267,25 +459,37 @@ class StatisticsSystem:
         start_date = end_date - timedelta(days=days)
         
         daily_stats = []
+        session_days = self._column('ts').astype('datetime64[D]')
+        scores = self._column('score')
+        accuracies = self._column('accuracy')
+        ducks_shot = self._column('ducks_shot')
+        durations = self._column('duration')
+        
+        # Day buckets need the sessions in time order
+        if not self._sessions_sorted:
+            order = np.argsort(session_days, kind='stable')
+            session_days = session_days[order]
+            scores = scores[order]
+            accuracies = accuracies[order]
+            ducks_shot = ducks_shot[order]
+            durations = durations[order]
+            
+        # Bucket edges: first session index of each day (plus the day after the last)
+        first_day = np.datetime64(start_date.strftime('%Y-%m-%d'))
+        edges = np.searchsorted(session_days, first_day + np.arange(days + 1)).tolist()
         
         for i in range(days):
-            current_date = start_date + timedelta(days=i)
-            date_str = current_date.strftime('%Y-%m-%d')
-            
-            # Filter sessions for this date
-            day_sessions = [
-                s for s in self.sessions 
-                if s.timestamp.startswith(date_str)
-            ]
+            date_str = str(first_day + i)
+            lo, hi = edges[i], edges[i + 1]
             
-            if day_sessions:
+            if hi > lo:
                 daily_stats.append({
                     'date': date_str,
-                    'games_played': len(day_sessions),
-                    'total_score': sum(s.score for s in day_sessions),
-                    'average_accuracy': statistics.mean(s.accuracy for s in day_sessions),
-                    'total_ducks_shot': sum(s.ducks_shot for s in day_sessions),
-                    'play_time': sum(s.duration for s in day_sessions)
+                    'games_played': hi - lo,
+                    'total_score': int(scores[lo:hi].sum()),
+                    'average_accuracy': float(accuracies[lo:hi].mean()),
+                    'total_ducks_shot': int(ducks_shot[lo:hi].sum()),
+                    'play_time': int(durations[lo:hi].sum())
                 })
             else:
                 daily_stats.append({
@@ -305,15 +509,15 @@ class StatisticsSystem:
             return {}
             
         # Get last 20 sessions for trend analysis
-        recent_sessions = sorted(self.sessions, key=lambda x: x.timestamp)[-20:]
+        recent = np.argsort(self._column('ts'), kind='stable')[-20:]
         
-        scores = [s.score for s in recent_sessions]
-        accuracies = [s.accuracy for s in recent_sessions]
+        scores = self._column('score')[recent].astype(np.float64)
+        accuracies = self._column('accuracy')[recent]
         
         # Calculate trends (simple linear regression)
         n = len(scores)
         if n > 1:
-            x_values = list(range(n))
+            x_values = np.arange(n, dtype=np.float64)
             
             # Score trend
             score_slope = self._calculate_slope(x_values, scores)
@@ -331,95 +535,128 @@ class StatisticsSystem:
             
         return {}
         
-    def _calculate_slope(self, x_values: List[int], y_values: List[float]) -> float:
-        """Calculate slope of linear regression"""
-        n = len(x_values)
-        if n < 2:
+    def _calculate_slope(self, x_values: np.ndarray, y_values: np.ndarray) -> float:
+        """Calculate slope of linear regression (float64 arrays)"""
+        if len(x_values) < 2:
             return 0.0
-            
-        sum_x = sum(x_values)
-        sum_y = sum(y_values)
-        sum_xy = sum(x * y for x, y in zip(x_values, y_values))
-        sum_x2 = sum(x * x for x in x_values)
-        
-        slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
-        return slope
+        return float(_slope(x_values, y_values))
         
     def update_achievement_stats(self, unlocked_count: int, total_points: int):
         """Update achievement-related statistics"""
         if self.player_stats:
             self.player_stats.achievements_unlocked = unlocked_count
             self.player_stats.total_achievement_points = total_points
+            self._dirty['stats'] = True
             self.save_data()
             
-    def save_data(self):
-        """Save all statistics data to files"""
-        # Save sessions
-        sessions_data = [s.to_dict() for s in self.sessions]
-        with open('game_sessions.json', 'w', encoding='utf-8') as f:
-            json.dump(sessions_data, f, indent=2, ensure_ascii=False)
-            
+    def save_data(self, force: bool = False):
+        """Save changed player stats and leaderboards, at most once per SAVE_INTERVAL unless forced"""
+        # Sessions are not saved here; they are appended to SESSIONS_LOG as they are recorded
+        now = time.monotonic()
+        if not force and now - self._last_flush < SAVE_INTERVAL:
+            return
+        self._last_flush = now
+        
         # Save player stats
-        if self.player_stats:
-            with open('player_stats.json', 'w', encoding='utf-8') as f:
-                json.dump(self.player_stats.to_dict(), f, indent=2, ensure_ascii=False)
+        if self._dirty['stats'] and self.player_stats:
+            _atomic_write('player_stats.json', _dumps(self.player_stats.to_dict(), indent=True))
+        self._dirty['stats'] = False
                 
         # Save leaderboards
-        leaderboards_data = {}
-        for mode, entries in self.leaderboards.items():
-            leaderboards_data[mode] = [e.to_dict() for e in entries]
+        if self._dirty['boards']:
+            leaderboards_data = {}
+            for mode in self.leaderboards:
+                leaderboards_data[mode] = [e.to_dict() for e in self._ranked_entries(mode)]
+                
+            _atomic_write('leaderboards.json', _dumps(leaderboards_data, indent=True))
+            self._dirty['boards'] = False
             
-        with open('leaderboards.json', 'w', encoding='utf-8') as f:
-            json.dump(leaderboards_data, f, indent=2, ensure_ascii=False)
+    def flush(self):
+        """Write any pending stats and leaderboard changes now"""
+        self.save_data(force=True)
             
     def load_data(self):
         """Load all statistics data from files"""
-        # Load sessions
+        # Load the most recent sessions only
         try:
-            with open('game_sessions.json', 'r', encoding='utf-8') as f:
-                sessions_data = json.load(f)
-                self.sessions = [GameSession.from_dict(data) for data in sessions_data]
+            with open(SESSIONS_LOG, 'rb+') as f:
+                recent = deque((line for line in f if line.strip()), maxlen=SESSION_WINDOW)
+                # A crash mid-append leaves a last line without its newline; cut it off
+                # so the next append starts on a fresh line
+                if recent and not recent[-1].endswith(b'\n'):
+                    f.truncate(f.tell() - len(recent.pop()))
+            self.sessions = [GameSession.from_dict(data) for data in _decode_session_lines(recent)]
         except FileNotFoundError:
-            self.sessions = []
+            # Migrate the older single-list file to the log once
+            try:
+                with open(LEGACY_SESSIONS_FILE, 'rb') as f:
+                    sessions_data = _loads(f.read())
+                    self.sessions = [GameSession.from_dict(data) for data in sessions_data]
+            except FileNotFoundError:
+                self.sessions = []
+            if self.sessions:
+                self._write_sessions_log()
+            self.sessions = self.sessions[-SESSION_WINDOW:]
+        self._sessions_sorted = all(a.timestamp <= b.timestamp
+                                    for a, b in zip(self.sessions, self.sessions[1:]))
+        self._rebuild_session_columns()
             
         # Load player stats
         try:
-            with open('player_stats.json', 'r', encoding='utf-8') as f:
-                stats_data = json.load(f)
+            with open('player_stats.json', 'rb') as f:
+                stats_data = _loads(f.read())
                 self.player_stats = PlayerStats.from_dict(stats_data)
         except FileNotFoundError:
             self.player_stats = None
             
         # Load leaderboards
         try:
-            with open('leaderboards.json', 'r', encoding='utf-8') as f:
-                leaderboards_data = json.load(f)
+            with open('leaderboards.json', 'rb') as f:
+                leaderboards_data = _loads(f.read())
                 self.leaderboards = {}
+                self._leaderboard_seq = 0
                 for mode, entries_data in leaderboards_data.items():
-                    self.leaderboards[mode] = [LeaderboardEntry.from_dict(data) for data in entries_data]
+                    for data in entries_data:
+                        entry = LeaderboardEntry.from_dict(data)
+                        entry.mode = self._mode_table[self._mode_code(entry.mode)]
+                        self._push_leaderboard_entry(mode, entry)
         except FileNotFoundError:
             self.leaderboards = {}
             
+    def _write_sessions_log(self):
+        """Rewrite SESSIONS_LOG from self.sessions"""
+        _atomic_write(SESSIONS_LOG, b''.join(_dumps(session.to_dict()) + b'\n' for session in self.sessions))
+                
     def reset_all_data(self):
         """Reset all statistics data"""
         self.sessions.clear()
+        self._sessions_sorted = True
+        self._write_sessions_log()
+        self._rebuild_session_columns()
         self.player_stats = self._create_empty_stats()
         self.leaderboards.clear()
-        self.save_data()
+        self._dirty['stats'] = self._dirty['boards'] = True
+        self.flush()
         
     def export_data(self, filename: str = "pyhunt_stats_export.json"):
         """Export all statistics data to a single file"""
+        # The full history, not just the loaded window
+        try:
+            with open(SESSIONS_LOG, 'rb') as f:
+                sessions_data = _decode_session_lines(line for line in f if line.strip())
+        except FileNotFoundError:
+            sessions_data = [s.to_dict() for s in self.sessions]
+            
         export_data = {
             'export_date': datetime.now().isoformat(),
-            'sessions': [s.to_dict() for s in self.sessions],
+            'sessions': sessions_data,
             'player_stats': self.player_stats.to_dict() if self.player_stats else None,
             'leaderboards': {
-                mode: [e.to_dict() for e in entries]
-                for mode, entries in self.leaderboards.items()
+                mode: [e.to_dict() for e in self._ranked_entries(mode)]
+                for mode in self.leaderboards
             }
         }
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
-            
-        return filename 
\ No newline at end of file
+        _atomic_write(filename, _dumps(export_data, indent=True))
+        
+        return filename
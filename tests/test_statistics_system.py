@@ -0,0 +1,57 @@
+"""
+Tests for the statistics session log
+"""
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from statistics_system import StatisticsSystem, SESSIONS_LOG
+
+SESSION_LINE = (b'{"timestamp":"2025-07-15T18:34:30","mode":"Cl\\u00e1sico","score":100,'
+                b'"ducks_shot":2,"total_shots":5,"accuracy":40.0,"time_remaining":0,'
+                b'"ai_level":1,"duration":60}\n')
+
+class SessionLogTest(unittest.TestCase):
+    """Loading the append-only session log"""
+    
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+        
+    def test_partial_trailing_line_is_skipped_and_truncated(self):
+        with open(SESSIONS_LOG, 'wb') as f:
+            f.write(SESSION_LINE * 2 + SESSION_LINE[:40])
+            
+        stats = StatisticsSystem()
+        self.assertEqual(len(stats.sessions), 2)
+        with open(SESSIONS_LOG, 'rb') as f:
+            self.assertEqual(f.read(), SESSION_LINE * 2)
+            
+        # The next append starts on its own line and loads back
+        stats.record_game_session({'score': 50, 'ducks_shot': 1, 'total_shots': 2, 'accuracy': 50.0}, 'Clásico')
+        self.assertEqual(len(StatisticsSystem().sessions), 3)
+        
+    def test_corrupt_line_is_skipped(self):
+        with open(SESSIONS_LOG, 'wb') as f:
+            f.write(SESSION_LINE + b'{"timestamp": oops}\n' + b'[1, 2]\n' + SESSION_LINE)
+            
+        self.assertEqual(len(StatisticsSystem().sessions), 2)
+        
+    def test_export_skips_corrupt_lines(self):
+        with open(SESSIONS_LOG, 'wb') as f:
+            f.write(SESSION_LINE + b'{"timestamp": oops}\n' + SESSION_LINE)
+            
+        with open(StatisticsSystem().export_data('export.json'), 'rb') as f:
+            self.assertEqual(len(json.load(f)['sessions']), 2)
+        
+if __name__ == '__main__':
+    unittest.main()
@@ -3,7 +3,14 @@ UI Manager Module
 Handles all user interface elements, menus, and rendering
 """
 import pygame
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+# Rendered text surfaces kept by UIManager._render
+TEXT_CACHE_SIZE = 256
+
+# Sky color behind the scene layers
+SKY_BLUE = (135, 206, 250)
 
 # Colors
 WHITE = (255, 255, 255)
@@ -26,31 +33,63 @@ class UIManager:
         self.screen = screen
         self.asset_manager = asset_manager
         
-        # Initialize fonts
-        self.font = pygame.font.SysFont('Arial', 24)
-        self.big_font = pygame.font.SysFont('Arial', 48)
-        self.small_font = pygame.font.SysFont('Arial', 18)
+        # Initialize fonts (Arial resolved once; None falls back to pygame's default font)
+        font_path = pygame.font.match_font('arial')
+        self.font = pygame.font.Font(font_path, 24)
+        self.big_font = pygame.font.Font(font_path, 48)
+        self.small_font = pygame.font.Font(font_path, 18)
+        
+        # (font id, text, color) -> rendered surface, least recently used first
+        self._text_cache: "OrderedDict[Tuple[int, str, Tuple[int, int, int]], pygame.Surface]" = OrderedDict()
         
         # Screen dimensions
         self.screen_width = screen.get_width()
         self.screen_height = screen.get_height()
         
-    def draw_menu(self):
-        """Draw main menu"""
-        # Clear screen
-        self.screen.fill((135, 206, 250))  # Light blue background
+        # HUD label -> (value it shows, rendered surface), re-rendered only when the value changes
+        self._hud_labels: Dict[str, Tuple[Any, pygame.Surface]] = {}
+        
+        # Controls help overlay during play, toggled with H
+        self.show_help = False
+        
+        # Menu, pause and help overlays never change, so they are rasterized once
+        self._build_static_surfaces()
+        
+    def _render(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Render antialiased text, reusing the surface while the same text is shown"""
+        key = (id(font), text, color)
+        cache = self._text_cache
+        surface = cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color).convert_alpha()
+            cache[key] = surface
+            if len(cache) > TEXT_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return surface
+        
+    def _build_static_surfaces(self):
+        """Pre-render the menu screen, pause overlay and controls help into surfaces"""
+        width, height = self.screen_width, self.screen_height
+        
+        # Areas redrawn by the HUD every PLAYING frame (stats, time/help, gesture box)
+        self.hud_rects = [
+            pygame.Rect(0, 0, 260, 100),
+            pygame.Rect(width - 310, 0, 310, 220),
+            pygame.Rect(10, height - 90, 200, 80)
+        ]
+        
+        # Menu: light blue background with title, subtitle and instructions
+        menu = pygame.Surface((width, height))
+        menu.fill((135, 206, 250))
         
-        # Title
-        title = self.big_font.render("DUCK HUNT", True, BLACK)
-        title_rect = title.get_rect(center=(self.screen_width // 2, 100))
-        self.screen.blit(title, title_rect)
+        title = self._render(self.big_font, "DUCK HUNT", BLACK)
+        menu.blit(title, title.get_rect(center=(width // 2, 100)))
         
-        # Subtitle
-        subtitle = self.font.render("Con Reconocimiento de Gestos", True, BLACK)
-        subtitle_rect = subtitle.get_rect(center=(self.screen_width // 2, 150))
-        self.screen.blit(subtitle, subtitle_rect)
+        subtitle = self._render(self.font, "Con Reconocimiento de Gestos", BLACK)
+        menu.blit(subtitle, subtitle.get_rect(center=(width // 2, 150)))
         
-        # Instructions
         instructions = [
             "Controles:",
             "• Mano abierta: Mover cursor",
@@ -62,111 +101,114 @@ class UIManager:
         
         y_offset = 220
         for instruction in instructions:
-            text = self.font.render(instruction, True, BLACK)
-            text_rect = text.get_rect(center=(self.screen_width // 2, y_offset))
-            self.screen.blit(text, text_rect)
+            text = self._render(self.font, instruction, BLACK)
+            menu.blit(text, text.get_rect(center=(width // 2, y_offset)))
             y_offset += 30
             
-        # Start instruction
-        start_text = self.font.render("Presiona ENTER para comenzar", True, RED)
-        start_rect = start_text.get_rect(center=(self.screen_width // 2, 400))
-        self.screen.blit(start_text, start_rect)
+        start_text = self._render(self.font, "Presiona ENTER para comenzar", RED)
+        menu.blit(start_text, start_text.get_rect(center=(width // 2, 400)))
+        self._menu_surface = menu.convert()
         
-    def draw_hud(self, game_info: Dict[str, Any]):
-        """Draw heads-up display during gameplay"""
-        # Score
-        score_text = self.font.render(f"Puntos: {game_info['score']}", True, WHITE)
-        self.screen.blit(score_text, (10, 10))
+        # Half-transparent black overlay dimming the scene (pause and game over)
+        dim_overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        dim_overlay.fill((0, 0, 0, 128))
+        self._dim_overlay = dim_overlay.convert_alpha()
         
-        # Ducks shot
-        ducks_text = self.font.render(f"Patos: {game_info['ducks_shot']}", True, WHITE)
-        self.screen.blit(ducks_text, (10, 40))
+        # Pause: the dim overlay with its text
+        pause = dim_overlay.copy()
         
-        # Accuracy
-        accuracy = game_info['accuracy']
-        accuracy_text = self.font.render(f"Precisión: {accuracy:.1f}%", True, WHITE)
-        self.screen.blit(accuracy_text, (10, 70))
+        pause_text = self._render(self.big_font, "PAUSA", WHITE)
+        pause.blit(pause_text, pause_text.get_rect(center=(width // 2, height // 2 - 50)))
         
-        # Time remaining
-        time_remaining = game_info['time_remaining'] // 1000  # Convert to seconds
-        time_text = self.font.render(f"Tiempo: {time_remaining}s", True, WHITE)
-        time_rect = time_text.get_rect()
-        time_rect.topright = (self.screen_width - 10, 10)
-        self.screen.blit(time_text, time_rect)
+        instruction_text = self._render(self.font, "Presiona P para continuar", WHITE)
+        pause.blit(instruction_text, instruction_text.get_rect(center=(width // 2, height // 2 + 20)))
+        self._pause_surface = pause.convert_alpha()
+        
+        # Controls help: 300x200 dark panel, drawn at (width - 310, 10)
+        help_panel = pygame.Surface((300, 200), pygame.SRCALPHA)
+        help_panel.fill((0, 0, 0, 200))
+        
+        help_lines = [
+            "Controles:",
+            "👋 Mano abierta: Mover",
+            "✊ Mano cerrada: Disparar",
+            "👆 Dedo índice: Apuntar",
+            "✌️ Paz: Menú",
+            "👍 Pulgar: Pausar"
+        ]
+        
+        y_offset = 10
+        for line in help_lines:
+            help_panel.blit(self._render(self.small_font, line, WHITE), (10, y_offset))
+            y_offset += 25
+        self._help_surface = help_panel.convert_alpha()
+        
+        self._static_size = (width, height)
+        
+    def draw_menu(self):
+        """Draw main menu"""
+        self.screen.blit(self._menu_surface, (0, 0))
         
-        # Shots
-        shots_text = self.font.render(f"Disparos: {game_info['total_shots']}", True, WHITE)
-        shots_rect = shots_text.get_rect()
-        shots_rect.topright = (self.screen_width - 10, 40)
-        self.screen.blit(shots_text, shots_rect)
+    def _hud_label(self, key: str, value: Any, fmt: str) -> pygame.Surface:
+        """Get the surface for a HUD label, formatting and rendering it only when its value changed"""
+        cached = self._hud_labels.get(key)
+        if cached is not None and cached[0] == value:
+            return cached[1]
+        surface = self._render(self.font, fmt.format(value), WHITE)
+        self._hud_labels[key] = (value, surface)
+        return surface
+        
+    def draw_hud(self, game_info: Dict[str, Any]):
+        """Draw heads-up display during gameplay"""
+        # Score, ducks shot and accuracy down the left edge
+        score_text = self._hud_label('score', game_info['score'], "Puntos: {}")
+        ducks_text = self._hud_label('ducks_shot', game_info['ducks_shot'], "Patos: {}")
+        accuracy_text = self._hud_label('accuracy', game_info['accuracy'], "Precisión: {:.1f}%")
+        
+        # Time remaining and shots right-aligned
+        time_remaining = game_info['time_remaining'] // 1000  # Convert to seconds
+        time_text = self._hud_label('time', time_remaining, "Tiempo: {}s")
+        time_rect = time_text.get_rect(topright=(self.screen_width - 10, 10))
+        shots_text = self._hud_label('total_shots', game_info['total_shots'], "Disparos: {}")
+        shots_rect = shots_text.get_rect(topright=(self.screen_width - 10, 40))
+        
+        # One batched blit for the whole HUD
+        self.screen.blits((
+            (score_text, (10, 10)),
+            (ducks_text, (10, 40)),
+            (accuracy_text, (10, 70)),
+            (time_text, time_rect),
+            (shots_text, shots_rect)
+        ), doreturn=False)
         
     def draw_paused(self):
         """Draw pause screen"""
-        # Semi-transparent overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(128)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
-        
-        # Pause text
-        pause_text = self.big_font.render("PAUSA", True, WHITE)
-        pause_rect = pause_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 - 50))
-        self.screen.blit(pause_text, pause_rect)
-        
-        # Instructions
-        instruction_text = self.font.render("Presiona P para continuar", True, WHITE)
-        instruction_rect = instruction_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 20))
-        self.screen.blit(instruction_text, instruction_rect)
+        self.screen.blit(self._pause_surface, (0, 0))
         
     def draw_game_over(self, game_info: Dict[str, Any]):
         """Draw game over screen"""
-        # Semi-transparent overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(128)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
-        
-        # Game over text
-        game_over_text = self.big_font.render("¡FIN DEL JUEGO!", True, RED)
-        game_over_rect = game_over_text.get_rect(center=(self.screen_width // 2, 100))
-        self.screen.blit(game_over_text, game_over_rect)
-        
-        # Final score
-        score_text = self.font.render(f"Puntuación Final: {game_info['score']}", True, WHITE)
-        score_rect = score_text.get_rect(center=(self.screen_width // 2, 180))
-        self.screen.blit(score_text, score_rect)
-        
-        # Ducks shot
-        ducks_text = self.font.render(f"Patos Abatidos: {game_info['ducks_shot']}", True, WHITE)
-        ducks_rect = ducks_text.get_rect(center=(self.screen_width // 2, 210))
-        self.screen.blit(ducks_text, ducks_rect)
-        
-        # Accuracy
+        center_x = self.screen_width // 2
         accuracy = game_info['accuracy']
-        accuracy_text = self.font.render(f"Precisión: {accuracy:.1f}%", True, WHITE)
-        accuracy_rect = accuracy_text.get_rect(center=(self.screen_width // 2, 240))
-        self.screen.blit(accuracy_text, accuracy_rect)
-        
-        # Total shots
-        shots_text = self.font.render(f"Total de Disparos: {game_info['total_shots']}", True, WHITE)
-        shots_rect = shots_text.get_rect(center=(self.screen_width // 2, 270))
-        self.screen.blit(shots_text, shots_rect)
-        
-        # Performance rating
         rating = self._get_performance_rating(accuracy, game_info['ducks_shot'])
-        rating_text = self.font.render(f"Calificación: {rating}", True, YELLOW)
-        rating_rect = rating_text.get_rect(center=(self.screen_width // 2, 310))
-        self.screen.blit(rating_text, rating_rect)
-        
-        # Restart instruction
-        restart_text = self.font.render("Presiona R para jugar de nuevo", True, GREEN)
-        restart_rect = restart_text.get_rect(center=(self.screen_width // 2, 360))
-        self.screen.blit(restart_text, restart_rect)
         
-        # Exit instruction
-        exit_text = self.font.render("Presiona ESC para salir", True, WHITE)
-        exit_rect = exit_text.get_rect(center=(self.screen_width // 2, 390))
-        self.screen.blit(exit_text, exit_rect)
+        # (font, text, color, center y) from the title down to the exit instruction
+        lines = (
+            (self.big_font, "¡FIN DEL JUEGO!", RED, 100),
+            (self.font, f"Puntuación Final: {game_info['score']}", WHITE, 180),
+            (self.font, f"Patos Abatidos: {game_info['ducks_shot']}", WHITE, 210),
+            (self.font, f"Precisión: {accuracy:.1f}%", WHITE, 240),
+            (self.font, f"Total de Disparos: {game_info['total_shots']}", WHITE, 270),
+            (self.font, f"Calificación: {rating}", YELLOW, 310),
+            (self.font, "Presiona R para jugar de nuevo", GREEN, 360),
+            (self.font, "Presiona ESC para salir", WHITE, 390)
+        )
+        
+        # Semi-transparent overlay, then all the text in one batched blit
+        calls = [(self._dim_overlay, (0, 0))]
+        for font, text, color, y in lines:
+            surface = self._render(font, text, color)
+            calls.append((surface, surface.get_rect(center=(center_x, y))))
+        self.screen.blits(calls, doreturn=False)
         
     def _get_performance_rating(self, accuracy: float, ducks_shot: int) -> str:
         """Get performance rating based on accuracy and ducks shot"""
@@ -194,53 +236,47 @@ class UIManager:
         info_bg = pygame.Surface((200, 80))
         info_bg.set_alpha(180)
         info_bg.fill(BLACK)
-        self.screen.blit(info_bg, (10, self.screen_height - 90))
         
-        # Gesture text
-        gesture_text = self.small_font.render(f"Gesto: {gesture}", True, WHITE)
-        self.screen.blit(gesture_text, (15, self.screen_height - 80))
-        
-        # Confidence text
-        conf_text = self.small_font.render(f"Confianza: {confidence:.1f}", True, WHITE)
-        self.screen.blit(conf_text, (15, self.screen_height - 60))
-        
-        # Position text
+        # Gesture, confidence and position text
+        gesture_text = self._render(self.small_font, f"Gesto: {gesture}", WHITE)
+        conf_text = self._render(self.small_font, f"Confianza: {confidence:.1f}", WHITE)
         pos = gesture_info.get('screen_position', (0, 0))
-        pos_text = self.small_font.render(f"Pos: ({pos[0]}, {pos[1]})", True, WHITE)
-        self.screen.blit(pos_text, (15, self.screen_height - 40))
+        pos_text = self._render(self.small_font, f"Pos: ({pos[0]}, {pos[1]})", WHITE)
+        
+        self.screen.blits((
+            (info_bg, (10, self.screen_height - 90)),
+            (gesture_text, (15, self.screen_height - 80)),
+            (conf_text, (15, self.screen_height - 60)),
+            (pos_text, (15, self.screen_height - 40))
+        ), doreturn=False)
         
     def draw_controls_help(self):
         """Draw controls help overlay"""
-        # Semi-transparent background
-        overlay = pygame.Surface((300, 200))
-        overlay.set_alpha(200)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (self.screen_width - 310, 10))
-        
-        # Help text
-        help_lines = [
-            "Controles:",
-            "👋 Mano abierta: Mover",
-            "✊ Mano cerrada: Disparar",
-            "👆 Dedo índice: Apuntar",
-            "✌️ Paz: Menú",
-            "👍 Pulgar: Pausar"
-        ]
-        
-        y_offset = 20
-        for line in help_lines:
-            text = self.small_font.render(line, True, WHITE)
-            self.screen.blit(text, (self.screen_width - 300, y_offset))
-            y_offset += 25
+        self.screen.blit(self._help_surface, (self.screen_width - 310, 10))
             
     def draw_all(self, game_state: int, game_info: Dict[str, Any], 
-                 sprites: pygame.sprite.LayeredUpdates, gesture_info: Optional[Dict[str, Any]] = None):
-        """Draw everything based on game state"""
-        # Clear screen
-        self.screen.fill((135, 206, 250))
-        
-        # Draw sprites
-        sprites.draw(self.screen)
+                 sprites: tuple, gesture_info: Optional[Dict[str, Any]] = None,
+                 dirty_rects: Optional[List[pygame.Rect]] = None) -> Optional[List[pygame.Rect]]:
+        """Draw everything based on game state; with dirty_rects (PLAYING only) just those areas and the HUD are redrawn and returned, else None"""
+        # Rebuild the static overlays if the display was resized (the old frame is stale then)
+        if self.screen.get_size() != self._static_size:
+            self.screen_width, self.screen_height = self.screen.get_size()
+            self._build_static_surfaces()
+            dirty_rects = None
+            
+        if dirty_rects is not None and game_state == PLAYING:
+            # Clip to the screen: sprites entering from the edges have partly off-screen rects
+            screen_rect = self.screen.get_rect()
+            changed = [rect.clip(screen_rect) for rect in dirty_rects + self.hud_rects]
+            self._restore_scene(sprites, changed)
+        else:
+            changed = None
+            # Clear screen
+            self.screen.fill(SKY_BLUE)
+            
+            # Draw sprite groups in layer order
+            for group in sprites:
+                group.draw(self.screen)
         
         # Draw UI based on state
         if game_state == MENU:
@@ -249,9 +285,23 @@ class UIManager:
             self.draw_hud(game_info)
             if gesture_info:
                 self.draw_gesture_info(gesture_info)
-            self.draw_controls_help()
+            if self.show_help:
+                self.draw_controls_help()
         elif game_state == PAUSED:
             self.draw_hud(game_info)
             self.draw_paused()
         elif game_state == GAME_OVER:
-            self.draw_game_over(game_info) 
\ No newline at end of file
+            self.draw_game_over(game_info)
+            
+        return changed
+            
+    def _restore_scene(self, sprites: tuple, rects: List[pygame.Rect]):
+        """Redraw the scene layers clipped to each rect, leaving the rest of the frame untouched"""
+        # The whole layer stack is redrawn per rect, so overlapping rects never blend alpha twice
+        screen = self.screen
+        for rect in rects:
+            screen.set_clip(rect)
+            screen.fill(SKY_BLUE)
+            for group in sprites:
+                group.draw(screen)
+        screen.set_clip(None) 
\ No newline at end of file